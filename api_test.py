@@ -0,0 +1,362 @@
+"""
+Civic Photo Quality Control API - Live Endpoint Smoke Test
+===========================================================
+Exercises the running API server (default http://localhost:5000) end to end.
+Start the server with `python app.py` first, then run `python api_test.py`.
+
+All requests go through a single shared `requests.Session` so urllib3's
+connection pool keeps the TCP connection to the server alive between tests
+instead of paying a fresh handshake per call.
+
+Author: Civic Quality Control Team
+Version: 2.0
+"""
+
+import asyncio
+import io
+import os
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# aiohttp enables the fully async runner; the threaded runner works without it.
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+# httpx (with the http2 extra) enables the multiplexed upload stress mode.
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+# requests_toolbelt streams multipart bodies instead of buffering them.
+try:
+    from requests_toolbelt import MultipartEncoder
+except ImportError:
+    MultipartEncoder = None
+
+API_BASE_URL = os.environ.get('API_BASE_URL', 'http://localhost:5000')
+TEST_IMAGE_PATH = os.environ.get('TEST_IMAGE_PATH', 'storage/temp/test_image.jpg')
+
+# Shared session: one connection pool for every request in the run, including
+# the preflight, so the handshake cost is paid at most once. Transient
+# failures retry through the same pool instead of opening new connections.
+SESSION = requests.Session()
+_adapter = HTTPAdapter(
+    pool_connections=1,
+    pool_maxsize=32,
+    max_retries=Retry(total=2, backoff_factor=0.1)
+)
+SESSION.mount('http://', _adapter)
+SESSION.mount('https://', _adapter)
+# Explicit keep-alive so older proxies don't downgrade the connection, with
+# generous timeout/max tuning so the server keeps the socket open across the
+# whole run instead of closing it between tests.
+SESSION.headers.update({
+    'Connection': 'keep-alive',
+    'Keep-Alive': 'timeout=60, max=1000',
+})
+
+
+def _load_test_image() -> bytes:
+    """Return JPEG bytes for the upload test, generating a sample if needed."""
+    if os.path.exists(TEST_IMAGE_PATH):
+        with open(TEST_IMAGE_PATH, 'rb') as f:
+            return f.read()
+
+    # Fall back to an in-memory generated image so the test can always run.
+    from PIL import Image
+    image = Image.new('RGB', (1024, 768), color=(180, 180, 180))
+    buffer = io.BytesIO()
+    image.save(buffer, format='JPEG')
+    return buffer.getvalue()
+
+
+def test_health_endpoint() -> bool:
+    """Check that /api/health reports a healthy service."""
+    response = SESSION.get(f"{API_BASE_URL}/api/health", timeout=10)
+    payload = response.json()
+    return response.status_code == 200 and payload.get('success') is True
+
+
+def test_validation_rules_endpoint() -> bool:
+    """Check that /api/validation-rules returns the active ruleset."""
+    response = SESSION.get(f"{API_BASE_URL}/api/validation-rules", timeout=10)
+    payload = response.json()
+    return response.status_code == 200 and 'blur' in (payload.get('data') or {})
+
+
+def test_api_info_endpoint() -> bool:
+    """Check that the OpenAPI specification is served."""
+    response = SESSION.get(f"{API_BASE_URL}/api/openapi.json", timeout=10)
+    return response.status_code == 200 and 'openapi' in response.json()
+
+
+def test_image_validation_endpoint() -> bool:
+    """Upload a sample image to /api/validate and check the payload shape."""
+    if MultipartEncoder is not None and os.path.exists(TEST_IMAGE_PATH):
+        # Stream the multipart body from disk in chunks rather than buffering
+        # the whole encoded request in memory before the first byte is sent.
+        with open(TEST_IMAGE_PATH, 'rb') as f:
+            encoder = MultipartEncoder(fields={
+                'image': (os.path.basename(TEST_IMAGE_PATH), f, 'image/jpeg')
+            })
+            response = SESSION.post(
+                f"{API_BASE_URL}/api/validate",
+                data=encoder,
+                headers={'Content-Type': encoder.content_type},
+                timeout=30
+            )
+    else:
+        response = SESSION.post(
+            f"{API_BASE_URL}/api/validate",
+            files={'image': ('test_image.jpg', _load_test_image(), 'image/jpeg')},
+            timeout=30
+        )
+    payload = response.json()
+    return response.status_code == 200 and 'checks' in (payload.get('data') or {})
+
+
+def test_batch_validation_endpoint() -> bool:
+    """Upload 16 images in a single POST to /api/validate-batch."""
+    image_bytes = _load_test_image()
+    files = [
+        ('images', (f'test_image_{i}.jpg', image_bytes, 'image/jpeg'))
+        for i in range(16)
+    ]
+    response = SESSION.post(
+        f"{API_BASE_URL}/api/validate-batch",
+        files=files,
+        timeout=120
+    )
+    payload = response.json()
+    return response.status_code == 200 and (payload.get('data') or {}).get('count') == 16
+
+
+def test_summary_endpoint() -> bool:
+    """Check that /api/summary returns aggregate statistics."""
+    response = SESSION.get(f"{API_BASE_URL}/api/summary", timeout=10)
+    payload = response.json()
+    return response.status_code == 200 and payload.get('success') is True
+
+
+# Serializes report output when tests run concurrently.
+_PRINT_LOCK = threading.Lock()
+
+
+async def fetch_json(session, method: str, path: str, **kwargs):
+    """Issue a request on the shared aiohttp session and decode the JSON body."""
+    async with session.request(method, f"{API_BASE_URL}{path}", **kwargs) as response:
+        return response.status, await response.json()
+
+
+async def async_test_health_endpoint(session) -> bool:
+    status, payload = await fetch_json(session, 'GET', '/api/health')
+    return status == 200 and payload.get('success') is True
+
+
+async def async_test_validation_rules_endpoint(session) -> bool:
+    status, payload = await fetch_json(session, 'GET', '/api/validation-rules')
+    return status == 200 and 'blur' in (payload.get('data') or {})
+
+
+async def async_test_api_info_endpoint(session) -> bool:
+    status, payload = await fetch_json(session, 'GET', '/api/openapi.json')
+    return status == 200 and 'openapi' in payload
+
+
+async def async_test_summary_endpoint(session) -> bool:
+    status, payload = await fetch_json(session, 'GET', '/api/summary')
+    return status == 200 and payload.get('success') is True
+
+
+async def async_test_image_validation_endpoint(session) -> bool:
+    form = aiohttp.FormData()
+    form.add_field('image', _load_test_image(),
+                   filename='test_image.jpg', content_type='image/jpeg')
+    status, payload = await fetch_json(session, 'POST', '/api/validate', data=form)
+    return status == 200 and 'checks' in (payload.get('data') or {})
+
+
+async def flood_validate(upload_count: int = 100) -> int:
+    """Issue many concurrent /validate uploads through one bounded connector.
+
+    The TCPConnector cap plus a semaphore keep the fan-out from exhausting
+    ephemeral ports or overwhelming the server with connection churn, while
+    aiohttp.FormData streams each multipart body.
+    """
+    image_bytes = _load_test_image()
+    connector = aiohttp.TCPConnector(
+        limit=100,
+        limit_per_host=100,
+        force_close=False,
+        enable_cleanup_closed=True
+    )
+    semaphore = asyncio.Semaphore(64)
+
+    async with aiohttp.ClientSession(connector=connector) as session:
+        async def upload_one() -> bool:
+            async with semaphore:
+                form = aiohttp.FormData()
+                form.add_field('image', io.BytesIO(image_bytes),
+                               filename='test_image.jpg', content_type='image/jpeg')
+                async with session.post(f"{API_BASE_URL}/api/validate",
+                                        data=form) as response:
+                    return response.status == 200
+
+        outcomes = await asyncio.gather(
+            *[upload_one() for _ in range(upload_count)],
+            return_exceptions=True
+        )
+
+    passed = sum(1 for outcome in outcomes if outcome is True)
+    print(f"{passed}/{upload_count} concurrent uploads succeeded")
+    return 0 if passed == upload_count else 1
+
+
+async def stress_validate(upload_count: int = 16) -> int:
+    """Fan out concurrent /validate uploads over one multiplexed connection.
+
+    Uses HTTP/2 when the server (or fronting proxy) negotiates it, so every
+    upload shares a single TCP connection instead of paying per-request
+    handshakes and congestion-window ramp-ups.
+    """
+    image_bytes = _load_test_image()
+    semaphore = asyncio.Semaphore(8)
+    limits = httpx.Limits(max_connections=10, max_keepalive_connections=10)
+
+    async with httpx.AsyncClient(base_url=API_BASE_URL, http2=True,
+                                 limits=limits, timeout=30) as client:
+        async def upload_one() -> bool:
+            async with semaphore:
+                response = await client.post(
+                    '/api/validate',
+                    files={'image': ('test_image.jpg', image_bytes, 'image/jpeg')}
+                )
+                return response.status_code == 200
+
+        outcomes = await asyncio.gather(
+            *[upload_one() for _ in range(upload_count)],
+            return_exceptions=True
+        )
+
+    passed = sum(1 for outcome in outcomes if outcome is True)
+    print(f"{passed}/{upload_count} concurrent uploads succeeded")
+    return 0 if passed == upload_count else 1
+
+
+async def main_async() -> int:
+    """Run every endpoint test concurrently on a single aiohttp event loop."""
+    tests = [
+        ("Health check", async_test_health_endpoint),
+        ("Validation rules", async_test_validation_rules_endpoint),
+        ("API info", async_test_api_info_endpoint),
+        ("Processing summary", async_test_summary_endpoint),
+        ("Image validation", async_test_image_validation_endpoint),
+    ]
+
+    connector = aiohttp.TCPConnector(limit=64, keepalive_timeout=30)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        try:
+            async with session.get(API_BASE_URL, timeout=aiohttp.ClientTimeout(total=5)):
+                pass
+        except aiohttp.ClientConnectionError:
+            print(f"Error: cannot reach {API_BASE_URL} - is the server running?")
+            return 1
+
+        outcomes = await asyncio.gather(
+            *[test_func(session) for _, test_func in tests],
+            return_exceptions=True
+        )
+
+    failures = 0
+    for (test_name, _), outcome in zip(tests, outcomes):
+        if isinstance(outcome, Exception):
+            print(f"[ERROR] {test_name}: {outcome}")
+            outcome = False
+        if not outcome:
+            failures += 1
+        print(f"[{'PASS' if outcome else 'FAIL'}] {test_name}")
+
+    print(f"\n{len(tests) - failures}/{len(tests)} tests passed")
+    return 0 if failures == 0 else 1
+
+
+def _run_test(test_name, test_func) -> bool:
+    """Run a single test, print its outcome, and return pass/fail."""
+    try:
+        passed = test_func()
+    except Exception as exc:
+        passed = False
+        with _PRINT_LOCK:
+            print(f"[ERROR] {test_name}: {exc}")
+    status = "PASS" if passed else "FAIL"
+    with _PRINT_LOCK:
+        print(f"[{status}] {test_name}")
+    return passed
+
+
+def main() -> int:
+    """Run every endpoint test against the live server and report results."""
+    # Read-only endpoint tests are independent and I/O-bound, so they are
+    # dispatched concurrently; the upload test runs afterwards on its own
+    # because it mutates server-side storage.
+    concurrent_tests = [
+        ("Health check", test_health_endpoint),
+        ("Validation rules", test_validation_rules_endpoint),
+        ("API info", test_api_info_endpoint),
+        ("Processing summary", test_summary_endpoint),
+    ]
+    total = len(concurrent_tests) + 2
+
+    with SESSION:
+        # Preflight: make sure the server is reachable before running tests.
+        try:
+            SESSION.get(API_BASE_URL, timeout=5)
+        except requests.ConnectionError:
+            print(f"Error: cannot reach {API_BASE_URL} - is the server running?")
+            return 1
+
+        failures = 0
+        with ThreadPoolExecutor(max_workers=len(concurrent_tests)) as executor:
+            futures = {
+                executor.submit(_run_test, name, func): name
+                for name, func in concurrent_tests
+            }
+            for future in as_completed(futures):
+                if not future.result():
+                    failures += 1
+
+        if not _run_test("Image validation", test_image_validation_endpoint):
+            failures += 1
+        if not _run_test("Batch validation", test_batch_validation_endpoint):
+            failures += 1
+
+        print(f"\n{total - failures}/{total} tests passed")
+        return 0 if failures == 0 else 1
+
+
+if __name__ == '__main__':
+    # --flood runs the bounded-concurrency upload fan-out (requires aiohttp).
+    if '--flood' in sys.argv:
+        if aiohttp is None:
+            print("Error: --flood requires aiohttp (pip install aiohttp)")
+            sys.exit(1)
+        sys.exit(asyncio.run(flood_validate()))
+    # --stress runs the HTTP/2 multiplexed upload fan-out (requires httpx).
+    if '--stress' in sys.argv:
+        if httpx is None:
+            print("Error: --stress requires httpx (pip install 'httpx[http2]')")
+            sys.exit(1)
+        sys.exit(asyncio.run(stress_validate()))
+    # Prefer the fully concurrent asyncio runner when aiohttp is installed;
+    # fall back to the threaded requests runner otherwise.
+    if aiohttp is not None and '--sync' not in sys.argv:
+        sys.exit(asyncio.run(main_async()))
+    sys.exit(main())
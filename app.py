@@ -21,5 +21,6 @@ if __name__ == '__main__':
     app.run(
         debug=app.config.get('DEBUG', False),  # Enable debug mode for development
         host='0.0.0.0',  # Listen on all network interfaces
-        port=int(os.environ.get('PORT', 5000))  # Default port 5000, configurable via environment
+        port=int(os.environ.get('PORT', 5000)),  # Default port 5000, configurable via environment
+        threaded=True  # Service parallel sockets and honour keep-alive connections
     )
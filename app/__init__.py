@@ -1,6 +1,53 @@
-from flask import Flask, render_template
+from flask import Flask, render_template, request
+from flask.json.provider import DefaultJSONProvider
+from functools import lru_cache
+import hashlib
 import os
 
+from config import config as config_map
+from app.routes.upload import upload_bp
+from app.utils.response_formatter import FastJSONResponse
+
+
+@lru_cache(maxsize=8)
+def _resolve_config(config_name: str):
+    """Resolve a configuration class by name, falling back to the default."""
+    return config_map.get(config_name, config_map['default'])
+
+# Optional dependency: orjson serializes the dict-heavy validation payloads
+# several times faster than stdlib json.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Set once the storage directories have been created; later factory calls
+# skip the filesystem checks entirely.
+_DIRS_READY = False
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider backed by orjson for faster (de)serialization."""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(
+            obj,
+            option=orjson.OPT_SERIALIZE_NUMPY,
+            default=self.default
+        ).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+# Optional dependency: resolved once at import time so repeated factory
+# calls skip the try/except machinery.
+try:
+    from flask_cors import CORS  # type: ignore
+except ImportError:
+    CORS = None
+    print("Warning: Flask-CORS not installed, CORS disabled")
+
 
 def create_app(config_name: str = 'default') -> Flask:
     """Application factory that wires configuration, blueprints, and assets."""
@@ -9,39 +56,70 @@ def create_app(config_name: str = 'default') -> Flask:
         template_folder='../templates',
         static_folder='../static'
     )
+    app.response_class = FastJSONResponse
 
     # Load configuration class by name with graceful fallback to default.
-    from config import config as config_map
-    config_class = config_map.get(config_name, config_map['default'])
-    app.config.from_object(config_class)
+    app.config.from_object(_resolve_config(config_name))
+
+    # Normalize once so per-upload extension checks are O(1) frozenset
+    # lookups regardless of how the config spells the collection.
+    app.config['ALLOWED_EXTENSIONS'] = frozenset(app.config['ALLOWED_EXTENSIONS'])
 
     # Enable CORS when the optional dependency is available.
-    try:
-        from flask_cors import CORS  # type: ignore
+    if CORS is not None:
         CORS(app)
-    except ImportError:
-        print("Warning: Flask-CORS not installed, CORS disabled")
+
+    # Use the faster orjson serializer for jsonify/get_json when installed.
+    if orjson is not None:
+        app.json = OrjsonProvider(app)
 
     # Ensure required storage directories exist so uploads succeed at runtime.
-    directories = [
-        app.config['UPLOAD_FOLDER'],
-        app.config.get('PROCESSED_FOLDER', 'storage/processed'),
-        app.config.get('REJECTED_FOLDER', 'storage/rejected')
-    ]
-
-    for directory in directories:
-        os.makedirs(directory, exist_ok=True)
-        gitkeep_path = os.path.join(directory, '.gitkeep')
-        if not os.path.exists(gitkeep_path):
-            open(gitkeep_path, 'a').close()
+    # Runs once per process: after the first successful setup, subsequent
+    # factory calls (per-test apps, multi-app setups) skip filesystem work.
+    global _DIRS_READY
+    if not _DIRS_READY:
+        directories = {
+            app.config['UPLOAD_FOLDER'],
+            app.config.get('PROCESSED_FOLDER', 'storage/processed'),
+            app.config.get('REJECTED_FOLDER', 'storage/rejected')
+        }
+
+        by_parent = {}
+        for directory in directories:
+            parent, name = os.path.split(directory.rstrip('/'))
+            by_parent.setdefault(parent or '.', {})[name] = directory
+
+        for parent, children in by_parent.items():
+            try:
+                existing = {entry.name for entry in os.scandir(parent) if entry.is_dir()}
+            except FileNotFoundError:
+                existing = set()
+            for name, directory in children.items():
+                if name not in existing:
+                    os.makedirs(directory, exist_ok=True)
+        _DIRS_READY = True
 
     # Register API blueprint.
-    from app.routes.upload import upload_bp
     app.register_blueprint(upload_bp, url_prefix='/api')
 
+    # Warm the image pipeline (OpenCV/NumPy import + kernel dispatch) so the
+    # first /validate request isn't an order of magnitude slower than the
+    # rest. With `gunicorn --preload` the warm state is shared by all workers.
+    if app.config.get('PREWARM', True):
+        from app.routes.upload import _warmup
+        _warmup()
+
+    # The landing page takes no template context, so render it once per app
+    # and serve cached bytes with an ETag for browser 304s.
+    with app.app_context():
+        index_body = render_template('index.html').encode('utf-8')
+    index_etag = hashlib.blake2b(index_body, digest_size=8).hexdigest()
+
     @app.route('/')
     def index():
         """Serve the main quality control interface."""
-        return render_template('index.html')
+        response = app.response_class(index_body, mimetype='text/html')
+        response.set_etag(index_etag)
+        return response.make_conditional(request)
 
     return app
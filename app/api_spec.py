@@ -540,3 +540,11 @@ OPENAPI_SPEC = {
         }
     }
 }
+
+
+# Serialized once at import time: the spec is immutable for the process
+# lifetime, so requests serve these bytes directly instead of re-serializing
+# the nested dict per call.
+import json as _json
+
+OPENAPI_SPEC_JSON = _json.dumps(OPENAPI_SPEC).encode('utf-8')
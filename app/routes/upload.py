@@ -1,17 +1,49 @@
-from flask import Blueprint, current_app, render_template, request, jsonify
+from flask import Blueprint, current_app, render_template, request
+import atexit
+import base64
+import copy
+import gzip
+import hashlib
+import json
+import mmap
 import os
-import uuid
+import re
+import shutil
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from werkzeug.datastructures import FileStorage
 from werkzeug.exceptions import RequestEntityTooLarge
 from werkzeug.utils import secure_filename
 
-from app.services.quality_control import QualityControlService
+# The exception type lives in a dependency-free module so catching it here
+# does not drag the OpenCV/NumPy stack in at boot.
+from app.utils.errors import ImageDecodeError
 from app.utils.response_formatter import ResponseFormatter
-from app.api_spec import OPENAPI_SPEC
+from app.api_spec import OPENAPI_SPEC, OPENAPI_SPEC_JSON
+from config import Config
 
 
 upload_bp = Blueprint('upload', __name__)
 
+# Shared Config instance: the validation rules never change at runtime, so
+# constructing Config per request is pure overhead.
+_CONFIG = Config()
+
+# Upper bound on remembered validation results (see _result_cache), and the
+# lock serializing lookups/insertions -- OrderedDict reordering is not safe
+# against the executor threads this module fans work out to.
+_RESULT_CACHE_MAX = 1024
+_result_cache_lock = threading.Lock()
+
+# Background workers for post-response disk work (moving validated images),
+# so the HTTP response isn't blocked on filesystem I/O. The atexit hook
+# drains queued moves before the process exits so no validated image is
+# left behind in the upload folder.
+EXECUTOR = ThreadPoolExecutor(max_workers=4)
+atexit.register(EXECUTOR.shutdown, wait=True)
+
 
 class UploadError(Exception):
     """Exception raised when an upload request is invalid."""
@@ -21,16 +53,103 @@ class UploadError(Exception):
         self.status_code = status_code
 
 
+@upload_bp.errorhandler(RequestEntityTooLarge)
+def _handle_too_large(exc):
+    """JSON 413 for bodies Werkzeug aborts on mid-read.
+
+    The handlers reject oversized requests up front from Content-Length;
+    this covers chunked bodies that blow past MAX_CONTENT_LENGTH without
+    declaring it.
+    """
+    return ResponseFormatter.error("File too large", 413)
+
+
+@upload_bp.errorhandler(Exception)
+def _handle_unexpected_error(exc):
+    """Log truly unexpected failures once and return a JSON 500.
+
+    Predictable failure modes are handled with typed exceptions in the
+    handlers; everything else lands here instead of per-route catch-alls,
+    so healthy request paths carry no traceback-formatting code.
+    """
+    current_app.logger.exception("Unhandled error in upload blueprint")
+    return ResponseFormatter.error("Internal server error", 500)
+
+
+_WARMED = False
+
+
+def _warmup() -> None:
+    """Import heavy dependencies and run a tiny probe so the first real
+    validation request doesn't pay the cold-start cost."""
+    global _WARMED
+    if _WARMED:
+        return
+    try:
+        import cv2
+        import numpy as np
+
+        probe = np.zeros((224, 224), dtype=np.uint8)
+        cv2.Laplacian(probe, cv2.CV_64F)
+    except Exception:  # pragma: no cover - warmup must never break startup
+        pass
+    _WARMED = True
+
+
+def _result_cache() -> OrderedDict:
+    """Return the per-app LRU cache of validation results keyed by content hash."""
+    return current_app.extensions.setdefault('result_cache', OrderedDict())
+
+
+def _get_qc_service():
+    """Return the app-wide QualityControlService, constructing it on first use.
+
+    The import happens here rather than at module scope so workers that only
+    serve docs/health endpoints never pay the OpenCV/NumPy import cost.
+    """
+    service = current_app.extensions.get('qc_service')
+    if service is None:
+        from app.services.quality_control import QualityControlService
+
+        service = QualityControlService(current_app.config)
+        current_app.extensions['qc_service'] = service
+    return service
+
+
+# Allowed extensions, bound to a module-level frozenset at registration so
+# the check needs no app-config lookup (see _ensure_upload_dir), plus the
+# fully-built rejection message for bad extensions.
+_ALLOWED = frozenset(e.lower() for e in _CONFIG.ALLOWED_EXTENSIONS)
+_BAD_EXT_MSG = f"File type not allowed. Allowed types: {', '.join(sorted(_ALLOWED))}"
+
+
 def allowed_file(filename: str) -> bool:
     """Return True when the provided filename has an allowed extension."""
-    if '.' not in filename:
-        return False
-    extension = filename.rsplit('.', 1)[1].lower()
-    return extension in current_app.config['ALLOWED_EXTENSIONS']
+    i = filename.rfind('.')
+    return i > 0 and filename[i + 1:].lower() in _ALLOWED
+
+
+# Magic numbers for the formats we accept (JPEG, PNG, BMP, TIFF in either
+# byte order), compiled into one alternation so sniffing is a single
+# C-level match instead of a Python loop over prefixes.
+_MAGIC_RE = re.compile(rb'^(?:\xff\xd8\xff|\x89PNG\r\n\x1a\n|BM|II\*\x00|MM\x00\*)')
+
+# Filenames that are already filesystem-safe skip secure_filename's regex
+# substitutions and unicode normalization entirely.
+_SAFE_NAME = re.compile(r'[\w.\-]+\Z', re.ASCII).match
+
+
+def _safe_name(filename: str) -> str:
+    """Sanitize a client filename, short-circuiting the common safe case."""
+    return filename if _SAFE_NAME(filename) else secure_filename(filename)
 
 
 def _extract_upload() -> FileStorage:
     """Pull the uploaded file from the request or raise UploadError."""
+    max_length = current_app.config.get('MAX_CONTENT_LENGTH')
+    if max_length and request.content_length and request.content_length > max_length:
+        raise UploadError("File too large", status_code=413)
+
     if 'image' not in request.files:
         raise UploadError("No image file provided", status_code=400)
 
@@ -39,21 +158,149 @@ def _extract_upload() -> FileStorage:
         raise UploadError("No file selected", status_code=400)
 
     if not allowed_file(file_storage.filename):
-        allowed = ', '.join(sorted(current_app.config['ALLOWED_EXTENSIONS']))
-        raise UploadError(f"File type not allowed. Allowed types: {allowed}")
+        raise UploadError(_BAD_EXT_MSG)
+
+    head = file_storage.stream.read(12)
+    file_storage.stream.seek(0)
+    if _MAGIC_RE.match(head) is None:
+        raise UploadError("File content does not match a supported image format")
 
     return file_storage
 
 
-def _store_upload(file_storage: FileStorage) -> str:
-    """Persist the uploaded file to the configured upload directory."""
-    upload_dir = current_app.config['UPLOAD_FOLDER']
+@upload_bp.record_once
+def _ensure_upload_dir(state) -> None:
+    """Normalize the upload directory and create it once at registration so
+    the per-request path skips the makedirs stat."""
+    upload_dir = state.app.config['UPLOAD_FOLDER'].rstrip('/')
+    state.app.config['UPLOAD_FOLDER'] = upload_dir
     os.makedirs(upload_dir, exist_ok=True)
 
-    filename = secure_filename(file_storage.filename)
-    unique_filename = f"{uuid.uuid4()}_{filename}"
-    filepath = os.path.join(upload_dir, unique_filename)
-    file_storage.save(filepath)
+    # Precompute the human-readable extension list so error paths skip the
+    # sort+join, even when hammered by misbehaving clients.
+    state.app.config['ALLOWED_EXTENSIONS_DISPLAY'] = ', '.join(
+        sorted(state.app.config['ALLOWED_EXTENSIONS'])
+    )
+
+    # Rebind the module-level whitelist in case this app overrides the
+    # default extension set, and bake the rejection message alongside it.
+    global _ALLOWED, _BAD_EXT_MSG
+    _ALLOWED = frozenset(e.lower() for e in state.app.config['ALLOWED_EXTENSIONS'])
+    _BAD_EXT_MSG = (
+        "File type not allowed. Allowed types: "
+        f"{state.app.config['ALLOWED_EXTENSIONS_DISPLAY']}"
+    )
+
+    # When prewarming, construct the service here too so the first /validate
+    # request doesn't pay for it. Apps that reconfigure storage paths after
+    # the factory (tests set PREWARM=False) still get the lazy path in
+    # _get_qc_service.
+    if state.app.config.get('PREWARM', True):
+        from app.services.quality_control import QualityControlService
+
+        state.app.extensions['qc_service'] = QualityControlService(state.app.config)
+
+
+# Chunk size for upload copies; also the O_DIRECT write unit (page-aligned
+# via mmap and a multiple of every sane filesystem block size).
+_COPY_BLOCK = 1 << 20
+
+
+def _save_upload_direct(stream, filepath: str) -> None:
+    """Write ``stream`` to ``filepath`` through O_DIRECT, bypassing the page
+    cache. Uploads are written once and read once, so caching them only
+    evicts hotter pages. The unaligned tail is flushed through a short
+    buffered append, since O_DIRECT requires block-multiple writes."""
+    fd = os.open(filepath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_DIRECT, 0o644)
+    buf = mmap.mmap(-1, _COPY_BLOCK)
+    view = memoryview(buf)
+    try:
+        while True:
+            n = stream.readinto(buf)
+            if not n:
+                return
+            if n == _COPY_BLOCK:
+                os.write(fd, view)
+            else:
+                os.close(fd)
+                fd = -1
+                with open(filepath, 'ab') as tail:
+                    tail.write(view[:n])
+                return
+    finally:
+        if fd >= 0:
+            os.close(fd)
+        view.release()
+        buf.close()
+
+
+def _save_upload(file_storage: FileStorage, filepath: str, use_o_direct: bool = False,
+                 fsync: bool = False) -> None:
+    """Copy an upload stream to ``filepath`` with the cheapest available path.
+
+    When Werkzeug spooled the body to a real temp file the bytes move with
+    os.sendfile -- an in-kernel copy with no userspace bounce buffer.
+    In-memory streams fall back to a 1MB copy loop (vs. the 16KB chunks of
+    FileStorage.save()). The O_DIRECT flag comes in as an argument so this
+    can run on executor threads with no app context, and ``fsync`` opts in
+    to an fdatasync before returning for deployments that need the upload
+    durable before the response goes out.
+    """
+    stream = file_storage.stream
+
+    # Optional page-cache bypass, off by default; tmpfs and some network
+    # filesystems reject O_DIRECT, in which case we fall through.
+    if use_o_direct and hasattr(os, 'O_DIRECT'):
+        try:
+            stream.seek(0)
+            _save_upload_direct(stream, filepath)
+            return
+        except OSError:
+            stream.seek(0)
+    try:
+        src_fd = stream.fileno()
+    except (AttributeError, OSError):
+        src_fd = None
+    with open(filepath, 'wb') as dst:
+        copied = False
+        if src_fd is not None and hasattr(os, 'sendfile'):
+            try:
+                os.lseek(src_fd, 0, os.SEEK_SET)
+                while os.sendfile(dst.fileno(), src_fd, None, 1 << 20):
+                    pass
+                copied = True
+            except OSError:
+                # sendfile may fail after writing some bytes; discard the
+                # partial destination too, or copyfileobj would append the
+                # full stream after it and corrupt the stored upload.
+                stream.seek(0)
+                dst.seek(0)
+                dst.truncate()
+        if not copied:
+            shutil.copyfileobj(stream, dst, length=_COPY_BLOCK)
+        if fsync:
+            dst.flush()
+            os.fdatasync(dst.fileno())
+
+
+def _unique_name(filename: str) -> str:
+    """Prefix a sanitized filename with 96 bits of randomness.
+
+    urlsafe_b64encode over os.urandom is cheaper than uuid4 (no UUID
+    object, no dash formatting) and yields a shorter name, which also
+    keeps path resolution fast.
+    """
+    return base64.urlsafe_b64encode(os.urandom(12)).decode('ascii') + '_' + _safe_name(filename)
+
+
+def _store_upload(file_storage: FileStorage) -> str:
+    """Persist the uploaded file to the configured upload directory."""
+    filepath = f"{current_app.config['UPLOAD_FOLDER']}/{_unique_name(file_storage.filename)}"
+    _save_upload(
+        file_storage, filepath,
+        use_o_direct=current_app.config.get('USE_O_DIRECT', False),
+        fsync=current_app.config.get('FSYNC_UPLOADS', False),
+    )
     return filepath
 
 
@@ -62,21 +309,64 @@ def validate_image_api():
     """Validate an uploaded image and return the consolidated scoring payload."""
     try:
         file_storage = _extract_upload()
-        filepath = _store_upload(file_storage)
-
-        qc_service = QualityControlService(current_app.config)
-        validation_results = qc_service.validate_image_with_new_rules(filepath)
-        qc_service.handle_validated_image(filepath, validation_results)
-
-        response_data = {
-            "summary": {
-                "overall_status": validation_results.get('overall_status'),
-                "overall_score": validation_results.get('overall_score'),
-                "issues_found": validation_results.get('issues_found'),
-                "recommendations": validation_results.get('recommendations', []),
-            },
-            "checks": validation_results.get('checks', {}),
-        }
+
+        # Identical uploads (retries, duplicates) are served straight from an
+        # in-memory LRU keyed on the file's content hash, skipping the whole
+        # validation pipeline.
+        file_bytes = file_storage.stream.read()
+        file_storage.stream.seek(0)
+        cache_key = hashlib.blake2b(file_bytes, digest_size=16).hexdigest()
+        cache = _result_cache()
+        with _result_cache_lock:
+            cached = cache.get(cache_key)
+            if cached is not None:
+                cache.move_to_end(cache_key)
+        if cached is not None:
+            return ResponseFormatter.success(
+                data=cached,
+                message="Image validation completed"
+            )
+
+        qc_service = _get_qc_service()
+
+        # Start the disk write on a worker thread and overlap it with the
+        # in-memory decode screen; the write only has to be joined before
+        # the pipeline reads the file back.
+        filepath = f"{current_app.config['UPLOAD_FOLDER']}/{_unique_name(file_storage.filename)}"
+        save_future = EXECUTOR.submit(
+            _save_upload, file_storage, filepath,
+            use_o_direct=current_app.config.get('USE_O_DIRECT', False),
+            fsync=current_app.config.get('FSYNC_UPLOADS', False),
+        )
+
+        bundle = qc_service.bundle_from_bytes(file_bytes)
+        if bundle is None:
+            # Garbage input: wait for the in-flight write, then drop the file.
+            save_future.result()
+            try:
+                os.remove(filepath)
+            except OSError:
+                pass
+            raise UploadError("Could not decode image file", status_code=400)
+
+        save_future.result()
+
+        # The service already returns the canonical {summary, checks} payload,
+        # so no per-request reshaping happens here. Passing the screen's
+        # decoded bundle through means the upload is decoded exactly once.
+        response_data = qc_service.validate_image_with_new_rules(filepath, bundle=bundle)
+        # The move worker annotates its payload (processed_path/rejected_path),
+        # so hand it a copy: mutating response_data here would race the
+        # serializer below and permanently poison the cached entry with
+        # server-side filesystem paths.
+        EXECUTOR.submit(
+            qc_service.handle_validated_image, filepath, copy.deepcopy(response_data)
+        )
+
+        with _result_cache_lock:
+            cache[cache_key] = response_data
+            if len(cache) > _RESULT_CACHE_MAX:
+                cache.popitem(last=False)
 
         return ResponseFormatter.success(
             data=response_data,
@@ -85,32 +375,139 @@ def validate_image_api():
 
     except UploadError as exc:
         return ResponseFormatter.error(str(exc), exc.status_code)
-    except RequestEntityTooLarge:
+    except ImageDecodeError as exc:
+        return ResponseFormatter.error(str(exc), 400)
+
+
+@upload_bp.route('/validate-batch', methods=['POST'])
+def validate_image_batch_api():
+    """Validate multiple uploaded images in a single request.
+
+    Accepts multipart form-data with any number of files under the
+    ``images`` field and runs each through the validation pipeline with a
+    single service instance, amortizing per-request overhead across the
+    whole batch.
+    """
+    max_length = current_app.config.get('MAX_CONTENT_LENGTH')
+    if max_length and request.content_length and request.content_length > max_length:
         return ResponseFormatter.error("File too large", 413)
-    except Exception as exc:  # pragma: no cover - defensive safeguard
-        return ResponseFormatter.error(f"Validation failed: {exc}", 500)
+
+    files = request.files.getlist('images')
+    if not files or all(f.filename == '' for f in files):
+        return ResponseFormatter.error("No image files provided", 400)
+
+    qc_service = _get_qc_service()
+
+    # Persist sequentially (the request stream must be consumed on this
+    # thread), then fan the CPU-bound validations out across the pool and
+    # join in submission order so results line up with the upload order.
+    entries = []
+    pending = []
+    for file_storage in files:
+        entry = {"filename": file_storage.filename}
+        entries.append(entry)
+        try:
+            if not allowed_file(file_storage.filename):
+                raise UploadError(_BAD_EXT_MSG)
+            head = file_storage.stream.read(12)
+            file_storage.stream.seek(0)
+            if _MAGIC_RE.match(head) is None:
+                raise UploadError("File content does not match a supported image format")
+            filepath = _store_upload(file_storage)
+        except UploadError as exc:
+            entry["error"] = str(exc)
+            continue
+        future = EXECUTOR.submit(qc_service.validate_image_with_new_rules, filepath)
+        pending.append((entry, filepath, future))
+
+    for entry, filepath, future in pending:
+        # Per-file failures (undecodable bytes that passed the magic sniff,
+        # unexpected pipeline errors) become an error entry for that file,
+        # mirroring validate_images -- one bad upload must not 500 the batch.
+        try:
+            validation_results = future.result()
+        except ImageDecodeError as exc:
+            entry["error"] = str(exc)
+            continue
+        except Exception:
+            current_app.logger.exception("Batch validation failed for %s", filepath)
+            entry["error"] = "Validation failed"
+            continue
+        # Same copy discipline as /validate: the move worker annotates its
+        # payload, and this dict is about to be serialized.
+        EXECUTOR.submit(
+            qc_service.handle_validated_image, filepath, copy.deepcopy(validation_results)
+        )
+        entry["summary"] = validation_results['summary']
+        entry["checks"] = validation_results['checks']
+
+    return ResponseFormatter.success(
+        data={"results": entries, "count": len(entries)},
+        message="Batch validation completed"
+    )
+
+
+def _static_json_response(body: bytes, gz_body: bytes, etag: str):
+    """Serve an immutable JSON payload with conditional-GET and gzip support."""
+    if request.if_none_match.contains(etag):
+        response = current_app.response_class(status=304)
+    elif gz_body is not None and 'gzip' in request.accept_encodings:
+        response = current_app.response_class(gz_body, mimetype='application/json')
+        response.headers['Content-Encoding'] = 'gzip'
+    else:
+        response = current_app.response_class(body, mimetype='application/json')
+    # The body is negotiated on Accept-Encoding, so shared caches must key
+    # on it -- otherwise a cached gzip body gets replayed to clients that
+    # never offered gzip.
+    response.vary.add('Accept-Encoding')
+    response.set_etag(etag)
+    # Rules only change between deploys; let clients revalidate hourly.
+    response.headers['Cache-Control'] = 'public, max-age=3600'
+    return response
+
+
+def _build_rules_response():
+    """Serialize the immutable ruleset once into a (body, gzip, etag) triple."""
+    payload = {
+        "success": True,
+        "message": "Current validation rules",
+        "data": _CONFIG.VALIDATION_RULES,
+        "error": None
+    }
+    body = json.dumps(payload).encode('utf-8')
+    etag = hashlib.blake2b(body, digest_size=16).hexdigest()
+    return body, gzip.compress(body, 6), etag
+
+
+_RULES_RESPONSE = _build_rules_response()
 
 
 @upload_bp.route('/validation-rules', methods=['GET'])
 def get_validation_rules():
     """Expose the active validation rules for clients and documentation."""
-    from config import Config
-    config = Config()
-    return ResponseFormatter.success(
-        data=config.VALIDATION_RULES,
-        message="Current validation rules"
-    )
+    return _static_json_response(*_RULES_RESPONSE)
+
+
 
 
 
+# Dashboards poll /summary every few seconds; the underlying directory scan
+# is only refreshed once per TTL window.
+_SUMMARY_TTL = 5.0
+_summary_cache = {'t': 0.0, 'v': None}
+_summary_lock = threading.Lock()
 
 
 @upload_bp.route('/summary', methods=['GET'])
 def get_processing_summary():
     """Return aggregate validation statistics for observability dashboards."""
     try:
-        qc_service = QualityControlService(current_app.config)
-        summary = qc_service.get_validation_summary()
+        now = time.monotonic()
+        with _summary_lock:
+            if _summary_cache['v'] is None or now - _summary_cache['t'] > _SUMMARY_TTL:
+                _summary_cache['v'] = _get_qc_service().get_validation_summary()
+                _summary_cache['t'] = now
+            summary = _summary_cache['v']
         return ResponseFormatter.success(
             data=summary,
             message="Processing summary retrieved"
@@ -119,33 +516,72 @@ def get_processing_summary():
         return ResponseFormatter.error(f"Failed to get summary: {exc}", 500)
 
 
+# Health probes arrive constantly from load balancers; the payload never
+# varies, so serialize it exactly once.
+_HEALTH_BODY = json.dumps({
+    "success": True,
+    "message": "Service is running",
+    "data": {
+        "status": "healthy",
+        "service": "photoguard",
+        "api_version": "3.0.0",
+        "validation_rules": "updated"
+    },
+    "error": None
+}).encode('utf-8')
+
+
 @upload_bp.route('/health', methods=['GET'])
 def health_check():
     """Simple health check endpoint for load balancers and monitors."""
-    return ResponseFormatter.success(
-        data={
-            "status": "healthy",
-            "service": "photoguard",
-            "api_version": "3.0.0",
-            "validation_rules": "updated"
-        },
-        message="Service is running"
-    )
+    response = current_app.response_class(_HEALTH_BODY, mimetype='application/json')
+    response.headers['Cache-Control'] = 'no-store'
+    return response
+
+
+# The spec and docs pages only change between deploys, so let browsers and
+# CDNs keep them for an hour and revalidate with ETags.
+_DOC_CACHE_CONTROL = 'public, max-age=3600, immutable'
+_SPEC_ETAG = hashlib.blake2b(OPENAPI_SPEC_JSON, digest_size=8).hexdigest()
+
+# (body, etag) pairs for the docs pages, rendered once at registration --
+# neither template uses request state, so per-GET Jinja rendering is waste.
+_DOC_PAGES = {}
+
+
+@upload_bp.record_once
+def _prerender_doc_pages(state) -> None:
+    """Render the static documentation templates once per process."""
+    with state.app.app_context():
+        for name in ('swagger.html', 'redoc.html'):
+            body = render_template(name).encode('utf-8')
+            etag = hashlib.blake2b(body, digest_size=8).hexdigest()
+            _DOC_PAGES[name] = (body, etag)
+
+
+def _cacheable(response, etag: str):
+    """Stamp caching headers on a static response and answer conditionals."""
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = _DOC_CACHE_CONTROL
+    return response.make_conditional(request)
 
 
 @upload_bp.route('/openapi.json', methods=['GET'])
 def get_openapi_spec():
     """Return the OpenAPI 3.1 specification in JSON format."""
-    return jsonify(OPENAPI_SPEC)
+    response = current_app.response_class(OPENAPI_SPEC_JSON, mimetype='application/json')
+    return _cacheable(response, _SPEC_ETAG)
 
 
 @upload_bp.route('/docs', methods=['GET'])
 def swagger_ui():
     """Serve the Swagger UI documentation page."""
-    return render_template('swagger.html')
+    body, etag = _DOC_PAGES['swagger.html']
+    return _cacheable(current_app.response_class(body, mimetype='text/html'), etag)
 
 
 @upload_bp.route('/redoc', methods=['GET'])
 def redoc_ui():
     """Serve the ReDoc documentation page."""
-    return render_template('redoc.html')
+    body, etag = _DOC_PAGES['redoc.html']
+    return _cacheable(current_app.response_class(body, mimetype='text/html'), etag)
@@ -1,9 +1,122 @@
 from typing import Dict, Tuple
+import asyncio
+import copy
+import errno
+import logging
 import os
+import threading
 import shutil
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
 from datetime import datetime
 
+from concurrent.futures import ThreadPoolExecutor
+
+# The check pool below owns parallelism: each validator task should run
+# single-threaded numeric kernels, otherwise N workers x M library
+# threads oversubscribe the cores and every task gets slower than
+# serial. The env caps must be in place before NumPy/OpenCV initialize
+# their thread pools, hence before the imports.
+os.environ.setdefault('OMP_NUM_THREADS', '1')
+os.environ.setdefault('MKL_NUM_THREADS', '1')
+
+import cv2
+import numpy as np
+
+# Make sure the runtime-dispatched SIMD kernels (cvtColor, Laplacian,
+# meanStdDev, resize) are enabled -- this is the default, but a stray
+# setUseOptimized(False) anywhere in the process would silently fall
+# back to the scalar reference paths.
+cv2.setUseOptimized(True)
+
+# OpenCV-internal threads per kernel. The check pool fans validators out
+# across threads, so the default of 1 keeps worker x kernel threads from
+# oversubscribing the cores; single-worker deployments that want the
+# intra-kernel parallelism back can raise CV_NUM_THREADS.
+cv2.setNumThreads(int(os.environ.get('CV_NUM_THREADS', '1')))
+
 from config import Config
+from app.utils.blur_detection import BlurDetector
+from app.utils.brightness_validation import BrightnessValidator
+from app.utils.errors import ImageDecodeError
+from app.utils.exposure_check import ExposureChecker
+from app.utils.image_io import decode_bgr
+from app.utils.metadata_extraction import MetadataExtractor
+from app.utils.resolution_check import ResolutionChecker
+
+# Shared pool for fanning the independent quality checks out across
+# threads. With the kernels pinned to one thread each (above), the pool
+# is capped at the core count so concurrent requests don't stack up more
+# runnable threads than the machine has cores.
+_CHECK_POOL = ThreadPoolExecutor(max_workers=min(os.cpu_count() or 2, 6))
+
+# Check names with their scoring weights as parallel tuples (structure of
+# arrays): the scoring loop walks both with zip instead of rebuilding and
+# probing a dict per request. Weights reflect importance for civic photos --
+# blur and resolution decide usability, metadata is nice to have.
+_CHECK_NAMES = ('blur', 'brightness', 'resolution', 'exposure', 'metadata')
+_CHECK_WEIGHTS = (25, 20, 25, 15, 15)
+
+# The statistical checks (brightness, exposure) analyze a half-resolution
+# grayscale copy: histogram distributions survive INTER_AREA downsampling,
+# and a quarter of the pixels cuts those stages accordingly. Blur is NOT
+# scored on this copy -- Laplacian variance lives in exactly the high
+# frequencies that downsampling removes, and no pixel-count scale can
+# recover it -- so the blur check always runs on the full-resolution gray.
+_DOWNSAMPLE_FACTOR = 0.5
+
+# Upper bound on remembered validation results per service instance.
+_RESULT_CACHE_MAX = 1024
+
+_logger = logging.getLogger(__name__)
+_CPU_BASELINE_LOGGED = False
+
+
+def _log_cpu_baseline() -> None:
+    """Log the compiled CPU baseline once per process so a build without
+    vector dispatch (no AVX2/NEON line) is visible in the startup log."""
+    global _CPU_BASELINE_LOGGED
+    if _CPU_BASELINE_LOGGED:
+        return
+    _CPU_BASELINE_LOGGED = True
+    for line in cv2.getBuildInformation().splitlines():
+        if line.strip().startswith('Baseline:'):
+            _logger.info("OpenCV CPU %s", line.strip())
+            break
+
+
+@dataclass(slots=True)
+class ImageBundle:
+    """Pixel data decoded once per image and shared across all checks.
+
+    ``gray_small`` is a half-resolution copy the statistical checks
+    (brightness, exposure) run on; blur scores on the full-resolution
+    ``gray``. ``width``/``height`` always describe the original image.
+    """
+    bgr: object
+    gray: object
+    gray_small: object
+    width: int
+    height: int
+
+
+@dataclass(slots=True)
+class PipelineOutput:
+    """Raw validator outputs for one image.
+
+    Each field holds the analyzer's unshaped output, a
+    ``{'error': ..., 'raised': True}`` marker when the validator raised,
+    or ``None`` when the check was not run (fast-fail / header
+    short-circuit). Formatters turn one of these into either public
+    response schema.
+    """
+    blur: Dict = None
+    brightness: Dict = None
+    resolution: Dict = None
+    exposure: Dict = None
+    metadata: Dict = None
+
 
 class QualityControlService:
     """Main service for image quality control and validation."""
@@ -15,6 +128,7 @@ class QualityControlService:
         Args:
             config: Config class instance or Flask config object
         """
+        _log_cpu_baseline()
         self.config = config
         
         # Handle both Config class and Flask config object
@@ -36,138 +150,126 @@ class QualityControlService:
             self.max_brightness = config.get('MAX_BRIGHTNESS', 220)
             self.min_resolution_width = config.get('MIN_RESOLUTION_WIDTH', 800)
             self.min_resolution_height = config.get('MIN_RESOLUTION_HEIGHT', 600)
+
+        # The validation rules are static configuration, so bind them (and
+        # the thresholds the checks index repeatedly) once here instead of
+        # re-instantiating Config and re-walking the nested dict per image.
+        if hasattr(config, 'VALIDATION_RULES'):
+            self._rules = config.VALIDATION_RULES
+        else:
+            self._rules = config.get('VALIDATION_RULES', Config.VALIDATION_RULES)
+        self._blur_min = self._rules['blur']['min_score']
+        self._brightness_range = self._rules['brightness']['range']
+        self._resolution_rules = self._rules['resolution']
+        self._exposure_min = self._rules['exposure']['min_score']
+        self._metadata_rules = self._rules['metadata']
+        self._required_meta_fields = frozenset(self._metadata_rules['required_fields'])
+
+        # Optional city bounding box, pre-extracted from the config dict to
+        # a flat float64 array so the per-image containment test does no
+        # dict lookups (and batches can test all points in one pass).
+        if hasattr(config, 'CITY_BOUNDARIES'):
+            boundaries = config.CITY_BOUNDARIES
+        else:
+            boundaries = config.get('CITY_BOUNDARIES')
+        if boundaries:
+            self._bbox = np.array([
+                boundaries['min_lat'], boundaries['max_lat'],
+                boundaries['min_lon'], boundaries['max_lon'],
+            ], dtype=np.float64)
+        else:
+            self._bbox = None
+
+        # Partial-credit scorers dispatched by check name: one dict lookup
+        # and call on the hot scoring path instead of a string if/elif chain.
+        self._partial_scorers = {
+            'blur': self._partial_blur,
+            'brightness': self._partial_brightness,
+            'resolution': self._partial_resolution,
+            'exposure': self._partial_exposure,
+            'metadata': self._partial_metadata,
+        }
+
+        # The destination folders never change for the life of the service,
+        # so create them once here instead of before every move.
+        os.makedirs(self.processed_folder, exist_ok=True)
+        os.makedirs(self.rejected_folder, exist_ok=True)
+
+        # Validating the same unchanged file twice (client retries,
+        # dashboards re-posting) skips the pipeline: results are cached
+        # against the file's (path, mtime, size) fingerprint, bounded LRU.
+        self._result_cache = OrderedDict()
+        self._result_cache_lock = threading.Lock()
+
+        # Folder counts for the summary endpoint are kept as counters:
+        # seeded with one scan here, then bumped on every move, so the
+        # summary is O(1) instead of an O(N) directory listing per call.
+        # Seeding must happen before any move lands -- a lazy scan inside
+        # the first _record_move would see that move's file on disk and
+        # count it twice for the life of the process.
+        self._count_lock = threading.Lock()
+        self._processed_count = len(os.listdir(self.processed_folder))
+        self._rejected_count = len(os.listdir(self.rejected_folder))
     
-    def validate_image(self, image_path: str) -> Dict:
+    @staticmethod
+    def decode_image_bytes(file_bytes: bytes):
+        """Decode an in-memory image buffer to a BGR array.
+
+        Returns ``None`` when the buffer is not a decodable image, letting
+        callers reject garbage uploads before any disk I/O happens.
+        """
+        buffer = np.frombuffer(file_bytes, dtype=np.uint8)
+        return cv2.imdecode(buffer, cv2.IMREAD_COLOR)
+
+    @classmethod
+    def bundle_from_bytes(cls, file_bytes: bytes):
+        """Decode an in-memory upload once into the shared pixel bundle.
+
+        Returns ``None`` for undecodable buffers. Routes that screen the
+        upload bytes before saving pass the resulting bundle straight into
+        the pipeline, so the screen's full-resolution decode is reused
+        instead of re-reading the file from disk.
+        """
+        bgr = cls.decode_image_bytes(file_bytes)
+        if bgr is None:
+            return None
+        return cls._bundle_from_bgr(bgr)
+
+    def validate_image(self, image_path: str, fast_fail: bool = False) -> Dict:
         """
         Perform comprehensive image quality validation.
 
         Args:
             image_path: Path to the uploaded image
+            fast_fail: Stop at the first high-severity issue instead of
+                running every validator. Skipped validators stay ``None``
+                in the payload; a high-severity issue already forces the
+                "rejected" status, so the remaining checks cannot change
+                the outcome. Defaults to False so existing callers keep
+                the full report.
 
         Returns:
             Dictionary with complete validation results
         """
         validation_start = datetime.now()
 
-        try:
-            # Initialize results structure
-            results = {
-                "timestamp": validation_start.isoformat(),
-                "image_path": image_path,
-                "overall_status": "pending",
-                "issues": [],
-                "warnings": [],
-                "validations": {
-                    "blur_detection": None,
-                    "brightness_validation": None,
-                    "resolution_check": None,
-                    "metadata_extraction": None
-                },
-                "metrics": {},
-                "recommendations": []
-            }
+        cache_key = self._fingerprint(('legacy', 'fast' if fast_fail else 'full'), image_path)
+        cached = self._cache_lookup(cache_key)
+        if cached is not None:
+            return cached
 
-            # 1. Blur Detection
-            try:
-                from app.utils.blur_detection import BlurDetector
-                blur_score, is_blurry = BlurDetector.calculate_blur_score(
-                    image_path, self.blur_threshold
-                )
-                results["validations"]["blur_detection"] = BlurDetector.get_blur_details(
-                    blur_score, self.blur_threshold
-                )
-                
-                if is_blurry:
-                    results["issues"].append({
-                        "type": "blur",
-                        "severity": "high",
-                        "message": f"Image is too blurry (score: {blur_score:.2f})"
-                    })
-                    results["recommendations"].append(
-                        "Take a new photo with better focus and stable camera"
-                    )
-                
-            except Exception as e:
-                results["validations"]["blur_detection"] = {"error": str(e)}
-                results["warnings"].append(f"Blur detection failed: {str(e)}")
-            
-            # 2. Brightness Validation
-            try:
-                from app.utils.brightness_validation import BrightnessValidator
-                brightness_analysis = BrightnessValidator.analyze_brightness(
-                    image_path, self.min_brightness, self.max_brightness
-                )
-                results["validations"]["brightness_validation"] = brightness_analysis
-                
-                if brightness_analysis["has_brightness_issues"]:
-                    severity = "high" if brightness_analysis["is_too_dark"] or brightness_analysis["is_too_bright"] else "medium"
-                    results["issues"].append({
-                        "type": "brightness",
-                        "severity": severity,
-                        "message": "Image has brightness/exposure issues"
-                    })
-                    results["recommendations"].append(
-                        "Adjust lighting conditions or use flash for better exposure"
-                    )
-                
-            except Exception as e:
-                results["validations"]["brightness_validation"] = {"error": str(e)}
-                results["warnings"].append(f"Brightness validation failed: {str(e)}")
-            
-            # 3. Resolution Check
-            try:
-                from app.utils.resolution_check import ResolutionChecker
-                resolution_analysis = ResolutionChecker.analyze_resolution(
-                    image_path, self.min_resolution_width, self.min_resolution_height
-                )
-                results["validations"]["resolution_check"] = resolution_analysis
-                
-                if not resolution_analysis["meets_min_resolution"]:
-                    results["issues"].append({
-                        "type": "resolution",
-                        "severity": "high",
-                        "message": f"Image resolution too low: {resolution_analysis['width']}x{resolution_analysis['height']}"
-                    })
-                    results["recommendations"].append(
-                        "Take photo with higher resolution camera or zoom in"
-                    )
-                
-            except Exception as e:
-                results["validations"]["resolution_check"] = {"error": str(e)}
-                results["warnings"].append(f"Resolution check failed: {str(e)}")
-            
-            # 4. Exposure Check
-            try:
-                from app.utils.exposure_check import ExposureChecker
-                exposure_analysis = ExposureChecker.analyze_exposure(image_path)
-                results["validations"]["exposure_check"] = exposure_analysis
-                
-                if not exposure_analysis["has_good_exposure"]:
-                    severity = "high" if exposure_analysis["is_underexposed"] or exposure_analysis["is_overexposed"] else "medium"
-                    results["issues"].append({
-                        "type": "exposure",
-                        "severity": severity,
-                        "message": f"Poor exposure quality: {exposure_analysis['exposure_quality']}"
-                    })
-                    
-                    # Add specific recommendations
-                    for rec in exposure_analysis["recommendations"]:
-                        if rec != "Exposure looks good":
-                            results["recommendations"].append(rec)
-                
-            except Exception as e:
-                results["validations"]["exposure_check"] = {"error": str(e)}
-                results["warnings"].append(f"Exposure check failed: {str(e)}")
-            
-            # 5. Metadata Extraction
+        try:
+            # Decode once for the pixel-based validators; when the file is
+            # not decodable each validator falls back to its path-based
+            # entry point, preserving the historical per-check error
+            # payloads instead of failing the whole validation.
             try:
-                from app.utils.metadata_extraction import MetadataExtractor
-                metadata = MetadataExtractor.extract_metadata(image_path)
-                results["validations"]["metadata_extraction"] = metadata
-                
-            except Exception as e:
-                results["validations"]["metadata_extraction"] = {"error": str(e)}
-                results["warnings"].append(f"Metadata extraction failed: {str(e)}")
+                bundle = self._load_image_bundle(image_path)
+            except ImageDecodeError:
+                bundle = None
+
+            output = self._run_pipeline(image_path, bundle=bundle, fast_fail=fast_fail)
+            results = self._format_legacy(output, image_path, validation_start)
 
             # Calculate overall metrics
             results["metrics"] = self._calculate_metrics(results)
@@ -179,6 +281,11 @@ class QualityControlService:
             processing_time = (datetime.now() - validation_start).total_seconds()
             results["processing_time_seconds"] = round(processing_time, 3)
 
+            # Remember the outcome before the move invalidates the path;
+            # re-validations of the moved-away file miss the stat and fall
+            # through to the full pipeline as before.
+            self._cache_store(cache_key, results)
+
             # Handle image based on status
             self._handle_image_result(image_path, results)
 
@@ -200,6 +307,257 @@ class QualityControlService:
                 "processing_time_seconds": (datetime.now() - validation_start).total_seconds()
             }
     
+    async def validate_image_async(self, image_path: str) -> Dict:
+        """Awaitable wrapper around :meth:`validate_image`.
+
+        Offloads the blocking OpenCV/PIL work to a worker thread via
+        ``asyncio.to_thread`` so async callers don't stall the event loop
+        for the duration of the checks. Internally the validators already
+        fan out on the module-level check pool, which exists once per
+        process rather than per call.
+        """
+        return await asyncio.to_thread(self.validate_image, image_path)
+
+    def _raw_blur(self, image_path: str, bundle=None) -> Dict:
+        """Raw blur measurement: {'score': ...} or a raised-error marker."""
+        try:
+            if bundle is not None:
+                score, _ = BlurDetector.calculate_blur_score_from_gray(
+                    bundle.gray, self.blur_threshold
+                )
+            else:
+                score, _ = BlurDetector.calculate_blur_score(
+                    image_path, self.blur_threshold
+                )
+            return {'score': score}
+        except Exception as e:
+            return {'error': str(e), 'raised': True}
+
+    def _raw_brightness(self, image_path: str, bundle=None) -> Dict:
+        """Raw brightness analysis dict, or a raised-error marker."""
+        try:
+            if bundle is not None:
+                return BrightnessValidator.analyze_brightness_from_gray(
+                    bundle.gray_small, self.min_brightness, self.max_brightness
+                )
+            return BrightnessValidator.analyze_brightness(
+                image_path, self.min_brightness, self.max_brightness
+            )
+        except Exception as e:
+            return {'error': str(e), 'raised': True}
+
+    def _raw_resolution(self, image_path: str) -> Dict:
+        """Raw resolution analysis dict, or a raised-error marker."""
+        try:
+            return ResolutionChecker.analyze_resolution(
+                image_path, self.min_resolution_width, self.min_resolution_height
+            )
+        except Exception as e:
+            return {'error': str(e), 'raised': True}
+
+    def _raw_exposure(self, image_path: str, bundle=None) -> Dict:
+        """Raw exposure analysis dict, or a raised-error marker."""
+        try:
+            if bundle is not None:
+                return ExposureChecker.analyze_exposure_from_gray(bundle.gray_small)
+            return ExposureChecker.analyze_exposure(image_path)
+        except Exception as e:
+            return {'error': str(e), 'raised': True}
+
+    def _raw_metadata(self, image_path: str) -> Dict:
+        """Raw extracted metadata dict, or a raised-error marker."""
+        try:
+            return MetadataExtractor.extract_metadata(image_path)
+        except Exception as e:
+            return {'error': str(e), 'raised': True}
+
+    def _is_hard_fail(self, name: str, raw: Dict) -> bool:
+        """Whether a raw output corresponds to a high-severity issue."""
+        if raw is None or raw.get('raised'):
+            return False
+        if name == 'blur':
+            return raw['score'] < self.blur_threshold
+        if name == 'brightness':
+            return bool(raw.get('is_too_dark') or raw.get('is_too_bright'))
+        if name == 'resolution':
+            return not raw.get('meets_min_resolution', True)
+        if name == 'exposure':
+            return bool(raw.get('is_underexposed') or raw.get('is_overexposed'))
+        return False
+
+    def _run_pipeline(self, image_path: str, bundle=None, fast_fail: bool = False,
+                      header_first: bool = False) -> PipelineOutput:
+        """Run the five checks once and return their raw outputs.
+
+        Both public validation methods share this orchestration; only the
+        formatters differ. Three execution modes:
+
+        - default: all five checks fan out concurrently on the check pool;
+        - ``fast_fail``: checks run serially, stopping after the first
+          high-severity failure (remaining fields stay ``None``);
+        - ``header_first``: resolution and metadata (header-only reads) run
+          before anything is decoded, and the pixel checks are skipped when
+          even perfect scores could no longer reach the pass threshold.
+          ``ImageDecodeError`` propagates when the decode is needed and the
+          file is not an image.
+        """
+        output = PipelineOutput()
+
+        if header_first:
+            header_futures = [
+                ('resolution', _CHECK_POOL.submit(self._raw_resolution, image_path)),
+                ('metadata', _CHECK_POOL.submit(self._raw_metadata, image_path)),
+            ]
+            for name, future in header_futures:
+                setattr(output, name, future.result())
+
+            header_checks = {
+                'resolution': self._new_check_resolution(output.resolution)[0],
+                'metadata': self._new_check_metadata(output.metadata)[0],
+            }
+            if self._best_case_score(header_checks) < 65:
+                # Even perfect pixel checks could not reach the pass
+                # threshold, so don't decode or analyze the pixels at all.
+                return output
+
+            if bundle is None:
+                bundle = self._load_image_bundle(image_path)
+            pixel_futures = [
+                ('blur', _CHECK_POOL.submit(self._raw_blur, image_path, bundle)),
+                ('brightness', _CHECK_POOL.submit(self._raw_brightness, image_path, bundle)),
+                ('exposure', _CHECK_POOL.submit(self._raw_exposure, image_path, bundle)),
+            ]
+            for name, future in pixel_futures:
+                setattr(output, name, future.result())
+            return output
+
+        tasks = (
+            ('blur', self._raw_blur, (image_path, bundle)),
+            ('brightness', self._raw_brightness, (image_path, bundle)),
+            ('resolution', self._raw_resolution, (image_path,)),
+            ('exposure', self._raw_exposure, (image_path, bundle)),
+            ('metadata', self._raw_metadata, (image_path,)),
+        )
+        if fast_fail:
+            for name, task, args in tasks:
+                raw = task(*args)
+                setattr(output, name, raw)
+                if self._is_hard_fail(name, raw):
+                    break
+        else:
+            futures = [(name, _CHECK_POOL.submit(task, *args)) for name, task, args in tasks]
+            for name, future in futures:
+                setattr(output, name, future.result())
+        return output
+
+    def _format_legacy(self, output: PipelineOutput, image_path: str,
+                       validation_start: datetime) -> Dict:
+        """Shape raw pipeline outputs into the legacy results schema."""
+        results = {
+            "timestamp": validation_start.isoformat(),
+            "image_path": image_path,
+            "overall_status": "pending",
+            "issues": [],
+            "warnings": [],
+            "validations": {
+                "blur_detection": None,
+                "brightness_validation": None,
+                "resolution_check": None,
+                "metadata_extraction": None
+            },
+            "metrics": {},
+            "recommendations": []
+        }
+        issues = results["issues"]
+        warnings = results["warnings"]
+        validations = results["validations"]
+        recommendations = results["recommendations"]
+
+        blur = output.blur
+        if blur is not None:
+            if blur.get('raised'):
+                validations["blur_detection"] = {"error": blur['error']}
+                warnings.append(f"Blur detection failed: {blur['error']}")
+            else:
+                score = blur['score']
+                validations["blur_detection"] = BlurDetector.get_blur_details(
+                    score, self.blur_threshold
+                )
+                if score < self.blur_threshold:
+                    issues.append({
+                        "type": "blur",
+                        "severity": "high",
+                        "message": f"Image is too blurry (score: {score:.2f})"
+                    })
+                    recommendations.append(
+                        "Take a new photo with better focus and stable camera"
+                    )
+
+        brightness = output.brightness
+        if brightness is not None:
+            if brightness.get('raised'):
+                validations["brightness_validation"] = {"error": brightness['error']}
+                warnings.append(f"Brightness validation failed: {brightness['error']}")
+            else:
+                validations["brightness_validation"] = brightness
+                if brightness["has_brightness_issues"]:
+                    severity = "high" if brightness["is_too_dark"] or brightness["is_too_bright"] else "medium"
+                    issues.append({
+                        "type": "brightness",
+                        "severity": severity,
+                        "message": "Image has brightness/exposure issues"
+                    })
+                    recommendations.append(
+                        "Adjust lighting conditions or use flash for better exposure"
+                    )
+
+        resolution = output.resolution
+        if resolution is not None:
+            if resolution.get('raised'):
+                validations["resolution_check"] = {"error": resolution['error']}
+                warnings.append(f"Resolution check failed: {resolution['error']}")
+            else:
+                validations["resolution_check"] = resolution
+                if not resolution["meets_min_resolution"]:
+                    issues.append({
+                        "type": "resolution",
+                        "severity": "high",
+                        "message": f"Image resolution too low: {resolution['width']}x{resolution['height']}"
+                    })
+                    recommendations.append(
+                        "Take photo with higher resolution camera or zoom in"
+                    )
+
+        exposure = output.exposure
+        if exposure is not None:
+            if exposure.get('raised'):
+                validations["exposure_check"] = {"error": exposure['error']}
+                warnings.append(f"Exposure check failed: {exposure['error']}")
+            else:
+                validations["exposure_check"] = exposure
+                if not exposure["has_good_exposure"]:
+                    severity = "high" if exposure["is_underexposed"] or exposure["is_overexposed"] else "medium"
+                    issues.append({
+                        "type": "exposure",
+                        "severity": severity,
+                        "message": f"Poor exposure quality: {exposure['exposure_quality']}"
+                    })
+
+                    # Add specific recommendations
+                    for rec in exposure["recommendations"]:
+                        if rec != "Exposure looks good":
+                            recommendations.append(rec)
+
+        metadata = output.metadata
+        if metadata is not None:
+            if metadata.get('raised'):
+                validations["metadata_extraction"] = {"error": metadata['error']}
+                warnings.append(f"Metadata extraction failed: {metadata['error']}")
+            else:
+                validations["metadata_extraction"] = metadata
+
+        return results
+
     def _calculate_metrics(self, results: Dict) -> Dict:
         """Calculate overall quality metrics."""
         metrics = {
@@ -216,11 +574,45 @@ class QualityControlService:
                 metrics["validations_completed"] += 1
             else:
                 metrics["validations_failed"] += 1
-        
-        # Calculate overall quality score
-        quality_scores = list(metrics["quality_scores"].values())
+
+        # Collect per-check scores normalized to [0, 1] using the
+        # thresholds bound in __init__. Checks that errored (or carry no
+        # numeric score) are simply absent from the dict.
+        validations = results["validations"]
+        quality_scores = {}
+
+        blur = validations.get("blur_detection") or {}
+        if "blur_score" in blur and self._blur_min:
+            quality_scores["blur"] = min(blur["blur_score"] / self._blur_min, 1.0)
+
+        brightness = validations.get("brightness_validation") or {}
+        if "quality_score" in brightness:
+            quality_scores["brightness"] = float(brightness["quality_score"])
+
+        resolution = validations.get("resolution_check") or {}
+        if "megapixels" in resolution:
+            recommended = self._resolution_rules.get("recommended_megapixels", 2)
+            quality_scores["resolution"] = min(resolution["megapixels"] / recommended, 1.0)
+
+        exposure = validations.get("exposure_check") or {}
+        if "dynamic_range" in exposure and self._exposure_min:
+            quality_scores["exposure"] = min(exposure["dynamic_range"] / self._exposure_min, 1.0)
+
+        metadata = validations.get("metadata_extraction") or {}
+        completeness = metadata.get("validation", {}).get("completeness_percentage")
+        if completeness is not None:
+            quality_scores["metadata"] = completeness / 100.0
+
+        metrics["quality_scores"] = {
+            name: round(score, 3) for name, score in quality_scores.items()
+        }
+
+        # Weighted mean with the same weights the new-format scoring uses,
+        # as one vectorized np.average over the checks that produced scores.
         if quality_scores:
-            metrics["overall_quality_score"] = round(sum(quality_scores) / len(quality_scores), 3)
+            values = [quality_scores[name] for name in _CHECK_NAMES if name in quality_scores]
+            weights = [w for name, w in zip(_CHECK_NAMES, _CHECK_WEIGHTS) if name in quality_scores]
+            metrics["overall_quality_score"] = round(float(np.average(values, weights=weights)), 3)
         else:
             metrics["overall_quality_score"] = 0.0
         
@@ -243,36 +635,91 @@ class QualityControlService:
             else:
                 return "needs_improvement"
     
+    @staticmethod
+    def _fingerprint(namespace: str, image_path: str):
+        """Cache key for a file's current on-disk state, or None if the
+        file cannot be stat'ed (already moved, deleted, ...)."""
+        try:
+            st = os.stat(image_path)
+        except OSError:
+            return None
+        return (namespace, image_path, st.st_mtime_ns, st.st_size)
+
+    def _cache_lookup(self, key):
+        """Return a deep copy of a cached result, refreshing its LRU slot."""
+        if key is None:
+            return None
+        with self._result_cache_lock:
+            cached = self._result_cache.get(key)
+            if cached is None:
+                return None
+            self._result_cache.move_to_end(key)
+            return copy.deepcopy(cached)
+
+    def _cache_store(self, key, result: Dict):
+        """Remember a result, evicting the least recently used entries."""
+        if key is None:
+            return
+        with self._result_cache_lock:
+            self._result_cache[key] = copy.deepcopy(result)
+            self._result_cache.move_to_end(key)
+            while len(self._result_cache) > _RESULT_CACHE_MAX:
+                self._result_cache.popitem(last=False)
+
+    @staticmethod
+    def _move_file(source: str, destination: str):
+        """Move with an atomic same-filesystem rename fast path.
+
+        ``os.replace`` is a single syscall when both paths live on the same
+        filesystem; the copy+unlink that ``shutil.move`` performs is only
+        needed when the rename fails with EXDEV (cross-device link).
+        """
+        try:
+            os.replace(source, destination)
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+            shutil.move(source, destination)
+
     def _handle_image_result(self, image_path: str, results: Dict):
         """Move image to appropriate folder based on validation results."""
         try:
             filename = os.path.basename(image_path)
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            new_filename = f"{timestamp}_{filename}"
+            # Nanosecond hex prefix: unique under bursty traffic (the old
+            # second-resolution strftime prefix collided and dropped files)
+            # and an order of magnitude cheaper to produce.
+            new_filename = f"{time.time_ns():x}_{filename}"
             
             if results["overall_status"] in ["excellent", "good", "acceptable"]:
                 # Move to processed folder
-                target_dir = self.processed_folder
-                destination = os.path.join(target_dir, new_filename)
-                os.makedirs(target_dir, exist_ok=True)
-                shutil.move(image_path, destination)
+                destination = os.path.join(self.processed_folder, new_filename)
+                self._move_file(image_path, destination)
+                self._record_move(accepted=True)
                 results["processed_path"] = destination
             else:
                 # Move to rejected folder for analysis
-                target_dir = self.rejected_folder
-                destination = os.path.join(target_dir, new_filename)
-                os.makedirs(target_dir, exist_ok=True)
-                shutil.move(image_path, destination)
+                destination = os.path.join(self.rejected_folder, new_filename)
+                self._move_file(image_path, destination)
+                self._record_move(accepted=False)
                 results["rejected_path"] = destination
                 
         except Exception as e:
             results["warnings"].append(f"Failed to move image file: {str(e)}")
 
+    def _record_move(self, accepted: bool):
+        """Bump the accepted/rejected counter after a successful move."""
+        with self._count_lock:
+            if accepted:
+                self._processed_count += 1
+            else:
+                self._rejected_count += 1
+
     def get_validation_summary(self) -> Dict:
         """Get summary statistics of validation results."""
         try:
-            processed_count = len(os.listdir(self.processed_folder)) if os.path.exists(self.processed_folder) else 0
-            rejected_count = len(os.listdir(self.rejected_folder)) if os.path.exists(self.rejected_folder) else 0
+            with self._count_lock:
+                processed_count = self._processed_count
+                rejected_count = self._rejected_count
             total_count = processed_count + rejected_count
             
             acceptance_rate = (processed_count / total_count * 100) if total_count > 0 else 0
@@ -287,12 +734,187 @@ class QualityControlService:
         except Exception as e:
             return {"error": f"Failed to generate summary: {str(e)}"}
 
-    def validate_image_with_new_rules(self, filepath):
-        """
-        Comprehensive image validation using updated validation rules.
-        
-        Returns detailed validation results in the new format.
+    @staticmethod
+    def _load_image_bundle(filepath) -> ImageBundle:
+        """Decode the image once for all pixel-based checks.
+
+        Previously every check re-opened and re-decoded the file; the JPEG
+        decode dominates per-check cost, so sharing one decode removes the
+        bulk of the duplicated work.
         """
+        bgr = decode_bgr(filepath)
+        if bgr is None:
+            raise ImageDecodeError("Could not load image file")
+        return QualityControlService._bundle_from_bgr(bgr)
+
+    @staticmethod
+    def _bundle_from_bgr(bgr) -> ImageBundle:
+        """Derive the shared grayscale views from a decoded BGR array."""
+        gray = cv2.cvtColor(bgr, cv2.COLOR_BGR2GRAY)
+        height, width = gray.shape
+        gray_small = cv2.resize(
+            gray, None,
+            fx=_DOWNSAMPLE_FACTOR, fy=_DOWNSAMPLE_FACTOR,
+            interpolation=cv2.INTER_AREA
+        )
+        return ImageBundle(bgr=bgr, gray=gray, gray_small=gray_small,
+                           width=width, height=height)
+
+    def _new_check_blur(self, raw: Dict):
+        """Shape the raw blur output into (check dict, recommendations)."""
+        if raw.get('raised'):
+            return {
+                'status': 'fail',
+                'score': 0,
+                'threshold': 150,
+                'reason': f"Blur detection failed: {raw['error']}"
+            }, []
+        score = raw['score']
+        status = "pass" if score >= self._blur_min else "fail"
+        check = {
+            'status': status,
+            'score': round(score, 2),
+            'threshold': self._blur_min,
+            'reason': 'Image sharpness is acceptable' if status == 'pass' else 'Image is too blurry for quality standards'
+        }
+        recommendations = [] if status == 'pass' else ['Take a clearer photo with better focus']
+        return check, recommendations
+
+    def _new_check_brightness(self, raw: Dict):
+        """Shape the raw brightness output into (check dict, recommendations)."""
+        if raw.get('raised'):
+            return {
+                'status': 'fail',
+                'mean_brightness': 0,
+                'range': [90, 180],
+                'reason': f"Brightness validation failed: {raw['error']}"
+            }, []
+        status = "pass" if raw.get('meets_requirements', False) else "fail"
+        check = {
+            'status': status,
+            'mean_brightness': raw.get('mean_brightness', 0),
+            'range': self._brightness_range,
+            'reason': 'Brightness is within the acceptable range' if status == 'pass' else 'Brightness is outside the acceptable range'
+        }
+        recommendations = [] if status == 'pass' else ['Take photo in better lighting conditions']
+        return check, recommendations
+
+    def _new_check_resolution(self, raw: Dict):
+        """Shape the raw resolution output into (check dict, recommendations)."""
+        rules = self._resolution_rules
+        if raw.get('raised'):
+            return {
+                'status': 'fail',
+                'width': 0,
+                'height': 0,
+                'megapixels': 0,
+                'min_required': "1024x1024, ≥1 MP",
+                'reason': f"Resolution check failed: {raw['error']}"
+            }, []
+        status = "pass" if raw.get('meets_requirements', False) else "fail"
+        check = {
+            'status': status,
+            'width': raw.get('width', 0),
+            'height': raw.get('height', 0),
+            'megapixels': raw.get('megapixels', 0),
+            'min_required': f"{rules['min_width']}x{rules['min_height']}, ≥{rules['min_megapixels']} MP",
+            'reason': 'Resolution meets the minimum requirements' if status == 'pass' else 'Resolution below minimum required size'
+        }
+        recommendations = [] if status == 'pass' else ['Use higher resolution camera setting']
+        return check, recommendations
+
+    def _new_check_exposure(self, raw: Dict):
+        """Shape the raw exposure output into (check dict, recommendations)."""
+        if raw.get('raised'):
+            return {
+                'status': 'fail',
+                'dynamic_range': 0,
+                'threshold': 150,
+                'reason': f"Exposure check failed: {raw['error']}"
+            }, []
+        status = "pass" if raw.get('meets_requirements', False) else "fail"
+        check = {
+            'status': status,
+            'dynamic_range': raw.get('dynamic_range', 0),
+            'threshold': self._exposure_min,
+            'reason': 'Exposure and dynamic range are excellent' if status == 'pass' else 'Exposure quality below acceptable standards'
+        }
+        recommendations = [
+            rec for rec in raw.get('recommendations', [])
+            if 'Exposure looks good' not in rec
+        ]
+        return check, recommendations
+
+    def _new_check_metadata(self, raw: Dict):
+        """Shape the raw metadata output into (check dict, recommendations)."""
+        rules = self._metadata_rules
+        if raw.get('raised'):
+            return {
+                'status': 'fail',
+                'completeness': 0,
+                'required_min': 30,
+                'missing_fields': rules['required_fields'],
+                'reason': f"Metadata extraction failed: {raw['error']}"
+            }, []
+        try:
+            # Extract validation info if available
+            validation_info = raw.get('validation', {})
+            completeness = validation_info.get('completeness_percentage', 0)
+            meets_requirements = completeness >= rules['min_completeness_percentage']
+
+            # Find missing fields
+            all_fields = self._required_meta_fields
+            extracted_fields = set()
+
+            # Check what fields we actually have
+            basic_info = raw.get('basic_info', {})
+            camera_settings = raw.get('camera_settings', {})
+
+            if basic_info.get('timestamp'):
+                extracted_fields.add('timestamp')
+            if basic_info.get('camera_make') or basic_info.get('camera_model'):
+                extracted_fields.add('camera_make_model')
+            if basic_info.get('orientation'):
+                extracted_fields.add('orientation')
+            if camera_settings.get('iso'):
+                extracted_fields.add('iso')
+            if camera_settings.get('shutter_speed'):
+                extracted_fields.add('shutter_speed')
+            if camera_settings.get('aperture'):
+                extracted_fields.add('aperture')
+
+            missing_fields = list(all_fields - extracted_fields)
+
+            status = "pass" if meets_requirements else "fail"
+            check = {
+                'status': status,
+                'completeness': completeness,
+                'required_min': rules['min_completeness_percentage'],
+                'missing_fields': missing_fields,
+                'reason': 'Sufficient metadata extracted' if status == 'pass' else 'Insufficient metadata extracted'
+            }
+            recommendations = [] if status == 'pass' else ['Ensure camera metadata is enabled']
+
+            if self._bbox is not None:
+                in_bounds = MetadataExtractor.validate_location(
+                    raw.get('gps_data'), self._bbox
+                )
+                check['location_in_bounds'] = in_bounds
+                if in_bounds is False:
+                    recommendations.append('Photo location is outside the service area')
+
+            return check, recommendations
+        except Exception as e:
+            return {
+                'status': 'fail',
+                'completeness': 0,
+                'required_min': 30,
+                'missing_fields': rules['required_fields'],
+                'reason': f'Metadata extraction failed: {str(e)}'
+            }, []
+
+    def _format_new(self, output: PipelineOutput) -> Dict:
+        """Shape raw pipeline outputs into the new-format response."""
         results = {
             'overall_status': 'pending',
             'overall_score': 0,
@@ -306,237 +928,145 @@ class QualityControlService:
             },
             'recommendations': []
         }
-        
-        import time
-        start_time = time.time()
-        
+
+        shapers = (
+            ('blur', self._new_check_blur, output.blur),
+            ('brightness', self._new_check_brightness, output.brightness),
+            ('resolution', self._new_check_resolution, output.resolution),
+            ('exposure', self._new_check_exposure, output.exposure),
+            ('metadata', self._new_check_metadata, output.metadata),
+        )
+        for name, shaper, raw in shapers:
+            if raw is None:
+                check, recommendations = {
+                    'status': 'skipped',
+                    'reason': 'Skipped: header checks already determine rejection'
+                }, []
+            else:
+                check, recommendations = shaper(raw)
+            self._merge_check(results, name, check, recommendations)
+
+        # Calculate overall status and score
+        self._calculate_overall_status_new_format(results)
+
+        return self._shape_new_format_response(results)
+
+    def validate_image_with_new_rules(self, filepath, bundle=None):
+        """
+        Comprehensive image validation using updated validation rules.
+
+        A thin wrapper over the shared check pipeline: the header-only
+        checks run first and the pixel checks are skipped when they already
+        settle the outcome (see ``_run_pipeline``), then the raw outputs
+        are shaped into the new {summary, checks} schema.
+
+        Accepts an optional pre-decoded ``bundle`` so batch callers can
+        overlap decoding across images; when omitted the image is decoded
+        here.
+
+        Returns detailed validation results in the new format.
+        """
+        cache_key = self._fingerprint('new', filepath)
+        cached = self._cache_lookup(cache_key)
+        if cached is not None:
+            return cached
+
         try:
-            # Load image for processing
-            import cv2
-            image = cv2.imread(filepath)
-            if image is None:
-                raise ValueError("Could not load image file")
-            
-            # 1. Blur Detection with new rules
-            try:
-                from app.utils.blur_detection import BlurDetector
-                from config import Config
-                config = Config()
-                blur_score, is_blurry = BlurDetector.calculate_blur_score(filepath, config.VALIDATION_RULES['blur']['min_score'])
-                blur_result = BlurDetector.get_blur_details(blur_score, config.VALIDATION_RULES['blur']['min_score'])
-                
-                status = "pass" if blur_result.get('meets_requirements', False) else "fail"
-                results['checks']['blur'] = {
-                    'status': status,
-                    'score': blur_result.get('blur_score', 0),
-                    'threshold': config.VALIDATION_RULES['blur']['min_score'],
-                    'reason': 'Image sharpness is acceptable' if status == 'pass' else 'Image is too blurry for quality standards'
-                }
-                
-                if status == "fail":
-                    results['issues_found'] += 1
-                    results['recommendations'].append('Take a clearer photo with better focus')
-                    
-            except Exception as e:
-                results['checks']['blur'] = {
-                    'status': 'fail',
-                    'score': 0,
-                    'threshold': 150,
-                    'reason': f'Blur detection failed: {str(e)}'
-                }
-                results['issues_found'] += 1
-            
-            # 2. Brightness Validation with new rules
-            try:
-                from app.utils.brightness_validation import BrightnessValidator
-                from config import Config
-                config = Config()
-                brightness_result = BrightnessValidator.analyze_brightness(
-                    filepath, 
-                    config.VALIDATION_RULES['brightness']['range'][0],
-                    config.VALIDATION_RULES['brightness']['range'][1]
-                )
-                
-                status = "pass" if brightness_result.get('meets_requirements', False) else "fail"
-                results['checks']['brightness'] = {
-                    'status': status,
-                    'mean_brightness': brightness_result.get('mean_brightness', 0),
-                    'range': config.VALIDATION_RULES['brightness']['range'],
-                    'reason': 'Brightness is within the acceptable range' if status == 'pass' else 'Brightness is outside the acceptable range'
-                }
-                
-                if status == "fail":
-                    results['issues_found'] += 1
-                    results['recommendations'].append('Take photo in better lighting conditions')
-                    
-            except Exception as e:
-                results['checks']['brightness'] = {
-                    'status': 'fail',
-                    'mean_brightness': 0,
-                    'range': [90, 180],
-                    'reason': f'Brightness validation failed: {str(e)}'
-                }
-                results['issues_found'] += 1
-            
-            # 3. Resolution Check with new rules
-            try:
-                from app.utils.resolution_check import ResolutionChecker
-                from config import Config
-                config = Config()
-                resolution_result = ResolutionChecker.analyze_resolution(
-                    filepath,
-                    config.VALIDATION_RULES['resolution']['min_width'],
-                    config.VALIDATION_RULES['resolution']['min_height']
-                )
-                
-                status = "pass" if resolution_result.get('meets_requirements', False) else "fail"
-                results['checks']['resolution'] = {
-                    'status': status,
-                    'width': resolution_result.get('width', 0),
-                    'height': resolution_result.get('height', 0),
-                    'megapixels': resolution_result.get('megapixels', 0),
-                    'min_required': f"{config.VALIDATION_RULES['resolution']['min_width']}x{config.VALIDATION_RULES['resolution']['min_height']}, ≥{config.VALIDATION_RULES['resolution']['min_megapixels']} MP",
-                    'reason': 'Resolution meets the minimum requirements' if status == 'pass' else 'Resolution below minimum required size'
-                }
-                
-                if status == "fail":
-                    results['issues_found'] += 1
-                    results['recommendations'].append('Use higher resolution camera setting')
-                    
-            except Exception as e:
-                results['checks']['resolution'] = {
-                    'status': 'fail',
-                    'width': 0,
-                    'height': 0,
-                    'megapixels': 0,
-                    'min_required': "1024x1024, ≥1 MP",
-                    'reason': f'Resolution check failed: {str(e)}'
-                }
-                results['issues_found'] += 1
-            
-            # 4. Exposure Check with new rules
-            try:
-                from app.utils.exposure_check import ExposureChecker
-                from config import Config
-                config = Config()
-                exposure_result = ExposureChecker.analyze_exposure(filepath)
-                
-                status = "pass" if exposure_result.get('meets_requirements', False) else "fail"
-                results['checks']['exposure'] = {
-                    'status': status,
-                    'dynamic_range': exposure_result.get('dynamic_range', 0),
-                    'threshold': config.VALIDATION_RULES['exposure']['min_score'],
-                    'reason': 'Exposure and dynamic range are excellent' if status == 'pass' else 'Exposure quality below acceptable standards'
-                }
-                
-                if status == "fail":
-                    results['issues_found'] += 1
-                    
-                # Add specific recommendations from the exposure checker
-                exposure_recommendations = exposure_result.get('recommendations', [])
-                for rec in exposure_recommendations:
-                    if rec not in results['recommendations'] and 'Exposure looks good' not in rec:
-                        results['recommendations'].append(rec)
-                    
-            except Exception as e:
-                results['checks']['exposure'] = {
-                    'status': 'fail',
-                    'dynamic_range': 0,
-                    'threshold': 150,
-                    'reason': f'Exposure check failed: {str(e)}'
-                }
-                results['issues_found'] += 1
-            
-            # 5. Metadata Extraction with new rules
-            try:
-                from app.utils.metadata_extraction import MetadataExtractor
-                from config import Config
-                config = Config()
-                metadata_result = MetadataExtractor.extract_metadata(filepath)
-                
-                # Extract validation info if available
-                validation_info = metadata_result.get('validation', {})
-                completeness = validation_info.get('completeness_percentage', 0)
-                meets_requirements = completeness >= config.VALIDATION_RULES['metadata']['min_completeness_percentage']
-                
-                # Find missing fields
-                all_fields = set(config.VALIDATION_RULES['metadata']['required_fields'])
-                extracted_fields = set()
-                
-                # Check what fields we actually have
-                basic_info = metadata_result.get('basic_info', {})
-                camera_settings = metadata_result.get('camera_settings', {})
-                
-                if basic_info.get('timestamp'):
-                    extracted_fields.add('timestamp')
-                if basic_info.get('camera_make') or basic_info.get('camera_model'):
-                    extracted_fields.add('camera_make_model')
-                if basic_info.get('orientation'):
-                    extracted_fields.add('orientation')
-                if camera_settings.get('iso'):
-                    extracted_fields.add('iso')
-                if camera_settings.get('shutter_speed'):
-                    extracted_fields.add('shutter_speed')
-                if camera_settings.get('aperture'):
-                    extracted_fields.add('aperture')
-                
-                missing_fields = list(all_fields - extracted_fields)
-                
-                status = "pass" if meets_requirements else "fail"
-                results['checks']['metadata'] = {
-                    'status': status,
-                    'completeness': completeness,
-                    'required_min': config.VALIDATION_RULES['metadata']['min_completeness_percentage'],
-                    'missing_fields': missing_fields,
-                    'reason': 'Sufficient metadata extracted' if status == 'pass' else 'Insufficient metadata extracted'
-                }
-                
-                if status == "fail":
-                    results['issues_found'] += 1
-                    results['recommendations'].append('Ensure camera metadata is enabled')
-                    
-            except Exception as e:
-                results['checks']['metadata'] = {
-                    'status': 'fail',
-                    'completeness': 0,
-                    'required_min': 30,
-                    'missing_fields': config.VALIDATION_RULES['metadata']['required_fields'],
-                    'reason': f'Metadata extraction failed: {str(e)}'
-                }
-                results['issues_found'] += 1
-            
-            # Calculate overall status and score
-            self._calculate_overall_status_new_format(results)
-            
-            return results
-            
-        except Exception as e:
+            output = self._run_pipeline(filepath, bundle=bundle, header_first=True)
+            response = self._format_new(output)
+            self._cache_store(cache_key, response)
+            return response
+
+        except ImageDecodeError:
+            raise
+        except Exception:
+            return self._shape_new_format_response({
+                'overall_status': 'fail',
+                'overall_score': 0,
+                'issues_found': 1,
+                'checks': {name: None for name in _CHECK_NAMES},
+                'recommendations': [],
+            })
+
+    @staticmethod
+    def _merge_check(results, name, check, recommendations):
+        """Fold one check's output into the shared results structure."""
+        results['checks'][name] = check
+        if check.get('status') == 'fail':
             results['issues_found'] += 1
-            results['overall_status'] = 'fail'
-            results['overall_score'] = 0
-            return results
+        for rec in recommendations:
+            if rec not in results['recommendations']:
+                results['recommendations'].append(rec)
+
+    def _best_case_score(self, checks) -> float:
+        """Upper bound on the overall score: checks not yet run count as
+        perfect, completed ones contribute their real (partial) score."""
+        total_weighted = 0.0
+        for check_name, weight in zip(_CHECK_NAMES, _CHECK_WEIGHTS):
+            check = checks.get(check_name)
+            if check is None or check.get('status') == 'pass':
+                score = 100.0
+            else:
+                score = self._calculate_partial_score(check_name, check)
+            total_weighted += score * weight
+        return total_weighted / 100.0
+
+    def validate_images(self, filepaths):
+        """Validate several images, overlapping their decodes.
+
+        All files are decoded concurrently on the check pool up front, then
+        each image's checks run against its pre-decoded bundle. Results come
+        back in input order; an undecodable file yields an ``{'error': ...}``
+        entry instead of aborting the batch.
+        """
+        decode_futures = [
+            _CHECK_POOL.submit(self._load_image_bundle, filepath)
+            for filepath in filepaths
+        ]
+
+        results = []
+        for filepath, future in zip(filepaths, decode_futures):
+            try:
+                bundle = future.result()
+            except ImageDecodeError as e:
+                results.append({'error': str(e), 'filepath': filepath})
+                continue
+            results.append(self.validate_image_with_new_rules(filepath, bundle))
+        return results
+
+    @staticmethod
+    def _shape_new_format_response(results):
+        """Reshape raw check results into the exact payload the API emits.
+
+        Returning the final {summary, checks} structure here means the route
+        handlers hand the dict straight to the serializer with no copying.
+        """
+        return {
+            'summary': {
+                'overall_status': results['overall_status'],
+                'overall_score': results['overall_score'],
+                'issues_found': results['issues_found'],
+                'recommendations': results['recommendations'],
+            },
+            'checks': results['checks'],
+        }
 
     def _calculate_overall_status_new_format(self, results):
         """Calculate overall status and score based on validation results in new format."""
         checks = results['checks']
         
-        # Weight different checks by importance for civic photos
-        check_weights = {
-            'blur': 25,      # Very important - blurry photos are unusable
-            'resolution': 25, # Important - need readable details
-            'brightness': 20, # Important but more tolerance
-            'exposure': 15,   # Less critical - can be adjusted
-            'metadata': 15    # Nice to have but not critical for civic use
-        }
-        
         total_weighted_score = 0
         total_weight = 0
         
-        for check_name, check_result in checks.items():
+        for check_name, weight in zip(_CHECK_NAMES, _CHECK_WEIGHTS):
+            check_result = checks.get(check_name)
             if check_result is not None:
-                weight = check_weights.get(check_name, 10)
                 if check_result.get('status') == 'pass':
                     score = 100
+                elif check_result.get('status') == 'skipped':
+                    # Pixel checks skipped because the outcome was already
+                    # settled; no credit.
+                    score = 0
                 else:
                     # Partial credit based on how close to passing
                     score = self._calculate_partial_score(check_name, check_result)
@@ -558,71 +1088,70 @@ class QualityControlService:
     
     def _calculate_partial_score(self, check_name, check_result):
         """Calculate partial score for failed checks."""
-        if check_name == 'blur':
-            score = check_result.get('score', 0)
-            threshold = check_result.get('threshold', 100)
-            # Give partial credit up to threshold
-            return min(80, (score / threshold) * 80) if score > 0 else 0
-            
-        elif check_name == 'brightness':
-            brightness = check_result.get('mean_brightness', 0)
-            range_min, range_max = check_result.get('range', [50, 220])
-            # Give partial credit if close to acceptable range
-            if brightness < range_min:
-                distance = range_min - brightness
-                return max(30, 80 - (distance / 50) * 50)
-            elif brightness > range_max:
-                distance = brightness - range_max
-                return max(30, 80 - (distance / 50) * 50)
-            return 70  # Close to range
-            
-        elif check_name == 'resolution':
-            megapixels = check_result.get('megapixels', 0)
-            # Give partial credit based on megapixels
-            if megapixels >= 0.3:  # At least VGA quality
-                return min(80, (megapixels / 0.5) * 80)
-            return 20
-            
-        elif check_name == 'exposure':
-            dynamic_range = check_result.get('dynamic_range', 0)
-            threshold = check_result.get('threshold', 100)
-            # Give partial credit
-            return min(70, (dynamic_range / threshold) * 70) if dynamic_range > 0 else 30
-            
-        elif check_name == 'metadata':
-            completeness = check_result.get('completeness', 0)
-            # Give partial credit for any metadata
-            return min(60, completeness * 2)  # Scale to 60 max
-            
-        return 20  # Default partial score
+        scorer = self._partial_scorers.get(check_name)
+        if scorer is None:
+            return 20  # Default partial score
+        return scorer(check_result)
+
+    @staticmethod
+    def _partial_blur(check_result):
+        score = check_result.get('score', 0)
+        threshold = check_result.get('threshold', 100)
+        # Give partial credit up to threshold
+        return min(80, (score / threshold) * 80) if score > 0 else 0
+
+    @staticmethod
+    def _partial_brightness(check_result):
+        brightness = check_result.get('mean_brightness', 0)
+        range_min, range_max = check_result.get('range', [50, 220])
+        # Give partial credit if close to acceptable range
+        if brightness < range_min:
+            distance = range_min - brightness
+            return max(30, 80 - (distance / 50) * 50)
+        elif brightness > range_max:
+            distance = brightness - range_max
+            return max(30, 80 - (distance / 50) * 50)
+        return 70  # Close to range
+
+    @staticmethod
+    def _partial_resolution(check_result):
+        megapixels = check_result.get('megapixels', 0)
+        # Give partial credit based on megapixels
+        if megapixels >= 0.3:  # At least VGA quality
+            return min(80, (megapixels / 0.5) * 80)
+        return 20
+
+    @staticmethod
+    def _partial_exposure(check_result):
+        dynamic_range = check_result.get('dynamic_range', 0)
+        threshold = check_result.get('threshold', 100)
+        # Give partial credit
+        return min(70, (dynamic_range / threshold) * 70) if dynamic_range > 0 else 30
+
+    @staticmethod
+    def _partial_metadata(check_result):
+        completeness = check_result.get('completeness', 0)
+        # Give partial credit for any metadata
+        return min(60, completeness * 2)  # Scale to 60 max
 
     def handle_validated_image(self, filepath, validation_results):
         """Move image to appropriate folder based on new validation results."""
         try:
-            import os
-            import shutil
-            import uuid
-            from datetime import datetime
-            
             filename = os.path.basename(filepath)
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            unique_id = str(uuid.uuid4())[:8]
-            new_filename = f"{timestamp}_{unique_id}_{filename}"
+            new_filename = f"{time.time_ns():x}_{filename}"
             
             # Use new scoring system - pass images with score >= 65
-            if validation_results['overall_status'] == 'pass':
+            if validation_results['summary']['overall_status'] == 'pass':
                 # Move to processed folder
-                target_dir = self.processed_folder
-                destination = os.path.join(target_dir, new_filename)
-                os.makedirs(target_dir, exist_ok=True)
-                shutil.move(filepath, destination)
+                destination = os.path.join(self.processed_folder, new_filename)
+                self._move_file(filepath, destination)
+                self._record_move(accepted=True)
                 validation_results['processed_path'] = destination
             else:
                 # Move to rejected folder for analysis
-                target_dir = self.rejected_folder
-                destination = os.path.join(target_dir, new_filename)
-                os.makedirs(target_dir, exist_ok=True)
-                shutil.move(filepath, destination)
+                destination = os.path.join(self.rejected_folder, new_filename)
+                self._move_file(filepath, destination)
+                self._record_move(accepted=False)
                 validation_results['rejected_path'] = destination
                 
         except Exception as e:
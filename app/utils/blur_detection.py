@@ -2,83 +2,122 @@ import cv2
 import numpy as np
 from typing import Optional, Tuple, Union
 
+from app.utils.image_io import decode_gray
 
-def blur_score(image: Optional[Union[str, bytes, np.ndarray]]) -> float:
-    """Return Laplacian variance for backward-compatible API calls.
+# Quality tiers shared by the scalar and batch classifiers: scores below
+# 150 are poor, 150-300 acceptable, 300+ excellent. searchsorted with
+# side='right' maps a score straight to its tier index.
+_TIER_THRESHOLDS = np.array([150.0, 300.0])
+_TIER_LEVELS = ('poor', 'acceptable', 'excellent')
+_TIER_LABELS = ('Poor', 'Acceptable', 'Excellent')
+_TIER_LEVELS_ARRAY = np.array(_TIER_LEVELS)
 
-    Accepts either a path to an image on disk or an in-memory numpy array.
-    When the input is ``None`` or invalid, ``0.0`` is returned so legacy
-    callers can treat the output as a failed blur computation.
+
+class BlurDetector:
+    """Detects image blur using Laplacian variance method.
+
+    Blur always scores at native resolution: Laplacian variance is
+    carried by the high frequencies that any downsampling removes, so a
+    shrunken copy cannot be rescaled back to full-resolution units and
+    the 100/150/300 thresholds only hold against native scores.
     """
-    if image is None:
-        return 0.0
 
-    try:
-        if isinstance(image, (str, bytes)):
-            frame = cv2.imread(image)
-        else:
-            frame = np.asarray(image)
+    @staticmethod
+    def blur_score(image: Optional[Union[str, bytes, np.ndarray]]) -> float:
+        """Return Laplacian variance for backward-compatible API calls.
 
-        if frame is None or frame.size == 0:
+        Accepts either a path to an image on disk or an in-memory numpy
+        array. When the input is ``None`` or invalid, ``0.0`` is returned
+        so legacy callers can treat the output as a failed blur
+        computation. Shares the decode and scoring path with
+        ``calculate_blur_score`` so optimizations land in both.
+        """
+        if image is None:
             return 0.0
 
-        if frame.ndim == 3:
-            gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-        else:
-            gray = frame
+        try:
+            if isinstance(image, (str, bytes)):
+                # Decode straight to luma: the codec emits Y directly,
+                # skipping the BGR interleave and the separate cvtColor pass.
+                gray = decode_gray(image)
+            else:
+                frame = np.asarray(image)
+                if frame.size == 0:
+                    return 0.0
+                gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY) if frame.ndim == 3 else frame
 
-        return float(cv2.Laplacian(gray, cv2.CV_64F).var())
-    except Exception:
-        return 0.0
+            if gray is None or gray.size == 0:
+                return 0.0
+
+            score, _ = BlurDetector.calculate_blur_score_from_gray(gray)
+            return score
+        except Exception:
+            return 0.0
 
-class BlurDetector:
-    """Detects image blur using Laplacian variance method."""
-    
     @staticmethod
     def calculate_blur_score(image_path: str, threshold: float = 100.0) -> Tuple[float, bool]:
         """
         Calculate blur score using Laplacian variance.
-        
+
         Args:
             image_path: Path to the image file
             threshold: Blur threshold (lower = more blurry)
-            
+
         Returns:
             Tuple of (blur_score, is_blurry)
         """
         try:
-            # Read image
-            image = cv2.imread(image_path)
-            if image is None:
+            # Decode straight to grayscale -- the color planes are never
+            # used, so skip the BGR decode and conversion entirely.
+            gray = decode_gray(image_path)
+            if gray is None:
                 raise ValueError(f"Could not read image from {image_path}")
-            
-            # Convert to grayscale
-            gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-            
-            # Calculate Laplacian variance
-            blur_score = cv2.Laplacian(gray, cv2.CV_64F).var()
-            
-            is_blurry = blur_score < threshold
-            
-            return blur_score, is_blurry
-            
+
+            return BlurDetector.calculate_blur_score_from_gray(gray, threshold)
+
         except Exception as e:
             raise Exception(f"Blur detection failed: {str(e)}")
+
+    @staticmethod
+    def calculate_blur_score_from_gray(gray: np.ndarray,
+                                       threshold: float = 100.0) -> Tuple[float, bool]:
+        """Calculate blur score from an already-decoded grayscale array.
+
+        Lets callers that decode the image once share the array across all
+        checks instead of re-reading the file from disk. The array must be
+        the native-resolution grayscale (see the class docstring).
+
+        The 3x3 stencil on uint8 input fits comfortably in int16
+        (|response| <= 4*255), so the Laplacian runs in CV_16S -- a quarter
+        of the fp64 bandwidth on a memory-bound op -- and the variance
+        comes from one cv2.meanStdDev pass instead of numpy materializing
+        a float64 temporary for ``.var()``.
+        """
+        lap = cv2.Laplacian(gray, cv2.CV_16S, ksize=1)
+        _, std = cv2.meanStdDev(lap)
+        blur_score = float(std[0, 0] ** 2)
+        is_blurry = blur_score < threshold
+        return blur_score, is_blurry
     
+    @staticmethod
+    def classify_batch(scores: np.ndarray) -> np.ndarray:
+        """Map an array of blur scores to their quality-level names.
+
+        One vectorized searchsorted over the tier thresholds classifies
+        any number of scores at once -- batch callers avoid the
+        per-element Python conditional ladder entirely.
+        """
+        tiers = np.searchsorted(_TIER_THRESHOLDS, scores, side='right')
+        return _TIER_LEVELS_ARRAY[tiers]
+
     @staticmethod
     def get_blur_details(blur_score: float, threshold: float) -> dict:
         """Get detailed blur analysis using new validation rules."""
-        # New validation levels
-        if blur_score >= 300:
-            quality = "Excellent"
-            quality_level = "excellent"
-        elif blur_score >= 150:
-            quality = "Acceptable"
-            quality_level = "acceptable"
-        else:
-            quality = "Poor"
-            quality_level = "poor"
-            
+        # New validation levels, via the same tier table as classify_batch
+        tier = int(np.searchsorted(_TIER_THRESHOLDS, blur_score, side='right'))
+        quality = _TIER_LABELS[tier]
+        quality_level = _TIER_LEVELS[tier]
+
         return {
             "blur_score": round(blur_score, 2),
             "threshold": threshold,
@@ -89,3 +128,7 @@ class BlurDetector:
             "meets_requirements": blur_score >= threshold,
             "validation_rule": "variance_of_laplacian"
         }
+
+# Backward-compatible module-level alias: existing callers (and the test
+# suite) import ``blur_score`` as a free function.
+blur_score = BlurDetector.blur_score
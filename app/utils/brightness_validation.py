@@ -2,6 +2,27 @@ import cv2
 import numpy as np
 from typing import Tuple, Dict
 
+from app.utils.image_io import decode_gray
+
+# Optional dependency: numba JIT-compiles the scalar scoring arithmetic,
+# removing the Python interpreter overhead from the per-image hot path.
+# Without it the plain Python function is used unchanged.
+try:
+    from numba import njit as _njit
+
+    def _maybe_jit(func):
+        return _njit(cache=True, fastmath=True)(func)
+except ImportError:
+    def _maybe_jit(func):
+        return func
+
+
+# Tail boundaries for the 256-bin histogram: very dark pixels are 0-50,
+# very bright 200-255. Precomputed so np.add.reduceat returns the tail
+# sums in one C-level call instead of separate slice+sum passes.
+_BRIGHTNESS_BOUNDS = np.array([0, 50, 200], dtype=np.intp)
+
+
 class BrightnessValidator:
     """Validates image brightness and exposure."""
     
@@ -20,25 +41,42 @@ class BrightnessValidator:
             Dictionary with brightness analysis results
         """
         try:
-            # Read image
-            image = cv2.imread(image_path)
-            if image is None:
+            # Decode straight to grayscale -- the analysis never touches the
+            # color planes, so skip the BGR decode and conversion entirely.
+            gray = decode_gray(image_path)
+            if gray is None:
                 raise ValueError(f"Could not read image from {image_path}")
+
+            return BrightnessValidator.analyze_brightness_from_gray(
+                gray, min_brightness, max_brightness
+            )
             
-            # Convert to grayscale for analysis
-            gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-            
-            # Calculate statistics
-            mean_brightness = np.mean(gray)
-            std_brightness = np.std(gray)
-            
-            # Calculate histogram
-            hist = cv2.calcHist([gray], [0], None, [256], [0, 256])
-            hist = hist.flatten()
-            
-            # Analyze exposure
-            dark_pixels = np.sum(hist[:50]) / hist.sum()  # Very dark pixels
-            bright_pixels = np.sum(hist[200:]) / hist.sum()  # Very bright pixels
+        except Exception as e:
+            raise Exception(f"Brightness analysis failed: {str(e)}")
+    
+    @staticmethod
+    def analyze_brightness_from_gray(gray: np.ndarray, min_brightness: int = 90,
+                                     max_brightness: int = 180) -> Dict:
+        """Analyze brightness from an already-decoded grayscale array, so
+        callers that decode once can share the array across checks."""
+        try:
+            # One pass over the pixels builds the 256-bin histogram; the
+            # mean, std, and tail ratios all fall out of it analytically,
+            # replacing three full-image traversals (mean, std, calcHist)
+            # on what is a purely memory-bound computation.
+            hist = np.bincount(gray.ravel(), minlength=256).astype(np.float64)
+            total = hist.sum()
+            bins = np.arange(256, dtype=np.float64)
+
+            mean_brightness = (hist * bins).sum() / total
+            variance = (hist * (bins - mean_brightness) ** 2).sum() / total
+            std_brightness = float(np.sqrt(variance))
+
+            # Analyze exposure tails (very dark 0-50, very bright 200-255)
+            # in a single reduceat call; the middle zone is unused.
+            dark_pixels, _, bright_pixels = (
+                np.add.reduceat(hist, _BRIGHTNESS_BOUNDS) / total
+            )
             
             # Determine issues
             is_too_dark = mean_brightness < min_brightness
@@ -84,6 +122,7 @@ class BrightnessValidator:
             raise Exception(f"Brightness analysis failed: {str(e)}")
     
     @staticmethod
+    @_maybe_jit
     def _calculate_quality_score(mean_brightness: float, std_brightness: float,
                                dark_ratio: float, bright_ratio: float) -> float:
         """Calculate overall brightness quality score (0-1)."""
@@ -0,0 +1,10 @@
+"""Dependency-free exception types shared across the app.
+
+These live apart from the modules that raise them so that route code can
+import the types at boot without dragging in the heavy imaging stack
+(OpenCV/NumPy) behind the service layer.
+"""
+
+
+class ImageDecodeError(Exception):
+    """Raised when an uploaded file cannot be decoded as an image."""
@@ -1,11 +1,26 @@
 import piexif
+import numpy as np
 from PIL import Image
 from PIL.ExifTags import TAGS
+import copy
 import json
 from datetime import datetime
+from functools import lru_cache
 from typing import Dict, Optional, Tuple
 import os
 
+
+@lru_cache(maxsize=2048)
+def _load_exif(image_path: str, mtime_ns: int, size: int) -> Optional[Dict]:
+    """Fingerprinted EXIF parse cache.
+
+    ``mtime_ns`` and ``size`` only participate in the cache key; an
+    overwritten file gets a fresh parse while repeat validations of the
+    same file skip the second full JPEG scan piexif/PIL performs.
+    """
+    return MetadataExtractor._extract_exif(image_path)
+
+
 class MetadataExtractor:
     """Extracts and validates image metadata."""
     
@@ -23,7 +38,7 @@ class MetadataExtractor:
         try:
             metadata = {
                 "file_info": MetadataExtractor._get_file_info(image_path),
-                "exif_data": MetadataExtractor._extract_exif(image_path),
+                "exif_data": MetadataExtractor._exif_cached(image_path),
                 "gps_data": None,
                 "camera_info": None,
                 "timestamp": None
@@ -67,6 +82,16 @@ class MetadataExtractor:
             "modified": datetime.fromtimestamp(stat.st_mtime).isoformat()
         }
     
+    @staticmethod
+    def _exif_cached(image_path: str) -> Optional[Dict]:
+        """EXIF data via the process-local cache, deep-copied so callers
+        can't mutate the cached entry."""
+        try:
+            stat = os.stat(image_path)
+        except OSError:
+            return MetadataExtractor._extract_exif(image_path)
+        return copy.deepcopy(_load_exif(image_path, stat.st_mtime_ns, stat.st_size))
+
     @staticmethod
     def _extract_exif(image_path: str) -> Optional[Dict]:
         """Extract EXIF data from image."""
@@ -87,6 +112,30 @@ class MetadataExtractor:
         except Exception:
             return None
     
+    @staticmethod
+    def validate_location(gps_data, bbox) -> Optional[object]:
+        """Test GPS coordinates against a precompiled bounding box.
+
+        ``bbox`` is (min_lat, max_lat, min_lon, max_lon) as a flat
+        array/tuple so the hot path does no dict lookups. Accepts either a
+        single gps dict (returns bool, or None when coordinates are
+        missing) or an (N, 2) array of (lat, lon) rows, which is tested in
+        one vectorized pass returning a boolean array.
+        """
+        if gps_data is None:
+            return None
+        if isinstance(gps_data, dict):
+            lat = gps_data.get("latitude")
+            lon = gps_data.get("longitude")
+            if lat is None or lon is None:
+                return None
+            return bool(bbox[0] <= lat <= bbox[1] and bbox[2] <= lon <= bbox[3])
+        points = np.asarray(gps_data, dtype=np.float64)
+        return (
+            (points[:, 0] >= bbox[0]) & (points[:, 0] <= bbox[1])
+            & (points[:, 1] >= bbox[2]) & (points[:, 1] <= bbox[3])
+        )
+
     @staticmethod
     def _extract_gps(exif_data: Dict) -> Optional[Dict]:
         """Extract GPS coordinates from EXIF data."""
@@ -1,11 +1,57 @@
-from flask import jsonify
+from flask import Response, current_app
 from typing import Dict, Any, Optional
 import json
 import numpy as np
 
+# Optional fast serializer; stdlib json remains the fallback.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class FastJSONResponse(Response):
+    """Response class that wraps pre-serialized JSON bytes directly.
+
+    Skips the str round-trip jsonify takes (dict -> str -> bytes) by
+    accepting the encoder's bytes output as-is. Installed as the app's
+    response_class; the default mimetype is left untouched so plain-string
+    views (e.g. rendered HTML) keep their text/html responses.
+    """
+
+    @classmethod
+    def from_bytes(cls, body: bytes, status_code: int = 200) -> 'FastJSONResponse':
+        return cls(body, status=status_code, mimetype='application/json')
+
+
 class ResponseFormatter:
     """Standardized API response formatter."""
-    
+
+    @staticmethod
+    def _serialize(payload: Dict) -> bytes:
+        """Encode a response payload to JSON bytes with the fastest
+        serializer available.
+
+        orjson handles numpy arrays/scalars and datetimes natively, so the
+        recursive sanitization pass only runs when a payload actually
+        contains something it cannot encode (surfaced as a TypeError) --
+        the common case serializes in a single C-level walk.
+        """
+        if orjson is not None:
+            try:
+                return orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY)
+            except TypeError:
+                payload = ResponseFormatter._make_json_serializable(payload)
+                return orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY)
+        payload = ResponseFormatter._make_json_serializable(payload)
+        return json.dumps(payload).encode('utf-8')
+
+    @staticmethod
+    def _json_response(payload: Dict, status_code: int):
+        """Build the (response, status) pair returned by all formatters."""
+        body = ResponseFormatter._serialize(payload)
+        return FastJSONResponse.from_bytes(body), status_code
+
     @staticmethod
     def _make_json_serializable(obj):
         """Convert non-serializable objects to JSON-serializable format."""
@@ -32,17 +78,13 @@ class ResponseFormatter:
     @staticmethod
     def success(data: Any = None, message: str = "Success", status_code: int = 200):
         """Format successful response."""
-        # Make data JSON serializable
-        if data is not None:
-            data = ResponseFormatter._make_json_serializable(data)
-            
         response = {
             "success": True,
             "message": message,
             "data": data,
             "error": None
         }
-        return jsonify(response), status_code
+        return ResponseFormatter._json_response(response, status_code)
     
     @staticmethod
     def error(message: str, status_code: int = 400, error_details: Optional[Dict] = None):
@@ -53,7 +95,7 @@ class ResponseFormatter:
             "data": None,
             "error": error_details or {"code": status_code, "message": message}
         }
-        return jsonify(response), status_code
+        return ResponseFormatter._json_response(response, status_code)
     
     @staticmethod
     def validation_response(validation_results: Dict):
@@ -33,6 +33,18 @@ class Config:
     
     # Maximum file upload size (16MB default, supports large mobile photos)
     MAX_CONTENT_LENGTH = int(os.environ.get('MAX_CONTENT_LENGTH', 16 * 1024 * 1024))
+
+    # Pre-import the image pipeline at startup so the first request is fast
+    PREWARM = os.environ.get('PREWARM', 'true').lower() in ('true', '1', 'yes')
+
+    # Write uploads with O_DIRECT (bypassing the page cache). Off by default;
+    # only worth enabling on local filesystems under heavy upload volume.
+    USE_O_DIRECT = os.environ.get('USE_O_DIRECT', 'false').lower() in ('true', '1', 'yes')
+
+    # fdatasync each upload before responding. Off by default: uploads are
+    # re-creatable by the client, so crash durability is rarely worth the
+    # extra flush per request.
+    FSYNC_UPLOADS = os.environ.get('FSYNC_UPLOADS', 'false').lower() in ('true', '1', 'yes')
     
     # ===================================================================
     # STORAGE CONFIGURATION
@@ -42,6 +54,11 @@ class Config:
     UPLOAD_FOLDER = os.environ.get('UPLOAD_FOLDER', 'storage/temp')  # Temporary upload storage
     PROCESSED_FOLDER = 'storage/processed'  # Accepted images (passed validation)
     REJECTED_FOLDER = 'storage/rejected'  # Rejected images (failed validation)
+
+    # Optional city bounding box for GPS validation. When set to a dict
+    # with min_lat/max_lat/min_lon/max_lon, photos carrying GPS EXIF are
+    # checked against it; None disables the check entirely.
+    CITY_BOUNDARIES = None
     
     # ===================================================================
     # BASIC IMAGE QUALITY THRESHOLDS (Mobile-Optimized)
@@ -175,6 +192,9 @@ class TestingConfig(Config):
     TESTING = True
     # Use in-memory friendly limits to keep tests fast
     MAX_CONTENT_LENGTH = int(os.environ.get('MAX_CONTENT_LENGTH', 8 * 1024 * 1024))
+    # No eager warmup/service construction: fixtures override storage paths
+    # after create_app, so the service must be built lazily per test app.
+    PREWARM = False
 
 
 # Configuration dictionary for easy access
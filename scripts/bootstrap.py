@@ -0,0 +1,41 @@
+"""
+Civic Photo Quality Control API - Storage Bootstrap
+====================================================
+One-shot setup of the storage directory tree, including the .gitkeep
+placeholders that keep empty directories under version control.
+
+Run once after checkout (or in the deploy image build):
+
+    python scripts/bootstrap.py
+
+The application factory only ensures the directories exist; seeding
+.gitkeep files is a version-control concern and lives here instead of on
+the runtime path.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import Config
+
+
+def bootstrap() -> None:
+    """Create the storage directories and seed .gitkeep placeholders."""
+    directories = [
+        Config.UPLOAD_FOLDER,
+        Config.PROCESSED_FOLDER,
+        Config.REJECTED_FOLDER,
+    ]
+
+    for directory in directories:
+        os.makedirs(directory, exist_ok=True)
+        gitkeep_path = os.path.join(directory, '.gitkeep')
+        if not os.path.exists(gitkeep_path):
+            open(gitkeep_path, 'a').close()
+        print(f"ready: {directory}")
+
+
+if __name__ == '__main__':
+    bootstrap()
@@ -43,6 +43,27 @@ def test_validate_endpoint_without_file(client):
     assert 'No image file provided' in payload['message']
 
 
+def test_validate_batch_endpoint(client):
+    def make_upload(name):
+        image = Image.new('RGB', (1024, 768), color=(180, 180, 180))
+        buffer = io.BytesIO()
+        image.save(buffer, format='JPEG')
+        buffer.seek(0)
+        return (buffer, name)
+
+    response = client.post(
+        '/api/validate-batch',
+        data={'images': [make_upload('first.jpg'), make_upload('second.jpg')]},
+        content_type='multipart/form-data'
+    )
+
+    assert response.status_code == 200
+    payload = response.get_json()
+    assert payload['success'] is True
+    assert payload['data']['count'] == 2
+    assert all('checks' in entry or 'error' in entry for entry in payload['data']['results'])
+
+
 def test_validate_endpoint_with_generated_image(client):
     image = Image.new('RGB', (1024, 768), color=(180, 180, 180))
     buffer = io.BytesIO()
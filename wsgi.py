@@ -2,6 +2,11 @@
 WSGI Entry Point for PhotoGuard API
 ====================================
 Production entry point for running the application with WSGI servers like Gunicorn.
+
+An ASGI adapter is also exposed so the app can be served by async servers,
+which avoids head-of-line blocking while a worker runs a long validation:
+
+    uvicorn wsgi:asgi_app --host 0.0.0.0 --port 5000 --workers 4
 """
 
 import os
@@ -11,6 +16,14 @@ from app import create_app
 # Use production config for Hugging Face Spaces deployment
 app = create_app(os.getenv('FLASK_ENV', 'production'))
 
+# Wrap the WSGI app for ASGI servers (uvicorn/hypercorn) when asgiref is
+# available; deployments without it keep using the plain WSGI entry point.
+try:
+    from asgiref.wsgi import WsgiToAsgi  # type: ignore
+    asgi_app = WsgiToAsgi(app)
+except ImportError:
+    asgi_app = None
+
 if __name__ == '__main__':
     # This is for debugging only
     app.run(host='0.0.0.0', port=7860)